@@ -1,15 +1,48 @@
-from source.components.apiClient.valorant_api_client import ValorantAPIClient
+import pandas as pd
+from source.components.apiClient.valorant_api_client import ValorantAPIClient, DEFAULT_LOCALE
+from source.components.apiClient.asset_downloader import AssetDownloader
 from source.components.jsonToPdTransformer.agents import agents_json_to_df
-from source.components.jsonToPdTransformer.weapons import weapons_json_to_df
+from source.components.jsonToPdTransformer.weapons import weapons_json_to_df, weapon_damage_ranges_json_to_df
 from source.components.jsonToPdTransformer.maps import maps_json_to_df
 from source.components.jsonToPdTransformer.gamemodes import gamemodes_json_to_df
 from source.components.jsonToPdTransformer.gears import gears_json_to_df
-from source.components.jsonToPdTransformer.competitivetiers import competitivetiers_json_to_df
+from source.components.jsonToPdTransformer.competitivetiers import competitivetiers_json_to_df, index_episodes
+from source.components.jsonToPdTransformer.localizations import localized_names_json_to_df
+from source.components.jsonToPdTransformer.diff import refresh_dimension
+from source.components.jsonToPdTransformer.skins import skins_json_to_df
+from source.components.jsonToPdTransformer.buddies import buddies_json_to_df
+from source.components.jsonToPdTransformer.playercards import playercards_json_to_df
+from source.components.jsonToPdTransformer.sprays import sprays_json_to_df
 from source.components.users import synthetic_users
+from source.components.dataStore.snapshot import load_dimensions, write_snapshot
+from source.components.dataStore.sqlite_loader import DIMENSION_TABLES, StarSchemaLoader
+from source.components.dataStore.run_cache import RunCache, code_version, run_key
 #from src.components.matchTimeline import base_params
 # from transformers.maps_transformer import maps_json_to_df
 # ...
 
+# Locales needed by the dashboards; the first one carries the full records
+LOCALES = [
+    DEFAULT_LOCALE, "de-DE", "es-ES", "es-MX", "fr-FR", "it-IT",
+    "ja-JP", "ko-KR", "pl-PL", "pt-BR", "ru-RU", "zh-CN",
+]
+
+# Files main() produces; stored per run so an unchanged run can restore them
+MAIN_OUTPUTS = [
+    f"data/{name}_dim.csv" for name in (
+        "agents", "weapons", "weapon_damage_ranges", "maps", "gamemodes", "gears", "competitive_tiers",
+        "users", "localized_names", "skins", "buddies", "playercards", "sprays", "asset_paths",
+    )
+] + ["data/manifests", "data/snapshot"]
+
+# Large cosmetic catalogues, streamed straight into their transformers
+COSMETICS = {
+    "skins": ("/weapons/skins", skins_json_to_df),
+    "buddies": ("/buddies", buddies_json_to_df),
+    "playercards": ("/playercards", playercards_json_to_df),
+    "sprays": ("/sprays", sprays_json_to_df),
+}
+
 def main():
     client = ValorantAPIClient()
 
@@ -21,20 +54,77 @@ def main():
     gears_json = client.get_gears()
     competitive_tiers_json = client.get_competitive_tiers()
 
-    # 2) Transform JSON → DataFrame using the respective transformer
-    df_agents = agents_json_to_df(agents_json)
-    df_weapons = weapons_json_to_df(weapons_json)
-    df_maps = maps_json_to_df(maps_json)
-    df_gamemodes = gamemodes_json_to_df(gamemodes_json)
-    df_gears = gears_json_to_df(gears_json)
-    df_competitive_tiers = competitivetiers_json_to_df(competitive_tiers_json)
+    # Localized names; the default locale is served from the response cache
+    localized_json = [
+        client.get_localized(path, LOCALES) for path in ("/agents", "/maps", "/weapons")
+    ]
+
+    # The cosmetics are identified by their ETags when the server sends them, so an
+    # unchanged run is restored before they are downloaded; otherwise they are
+    # streamed now and their transformed content is hashed.
+    cosmetic_validators = {name: client.validator(path) for name, (path, _) in COSMETICS.items()}
+    cosmetic_frames = None
+    if None in cosmetic_validators.values():
+        cosmetic_frames = {name: client.stream_to_df(path, transformer) for name, (path, transformer) in COSMETICS.items()}
+        cosmetics_digest = run_key({
+            name: int(pd.util.hash_pandas_object(df.astype(str), index=False).sum())
+            for name, df in cosmetic_frames.items()
+        })
+    else:
+        cosmetics_digest = run_key(cosmetic_validators)
+
+    # Content address of this run: same API data and code -> restore the stored outputs
+    run_inputs = {
+        "api": run_key([
+            agents_json, weapons_json, maps_json, gamemodes_json, gears_json,
+            competitive_tiers_json, localized_json,
+        ]),
+        "cosmetics": cosmetics_digest,
+        "locales": LOCALES,
+        "code": code_version(),
+    }
+    key = run_key(run_inputs)
+    run_cache = RunCache(root="data/runs/main")
+    if run_cache.restore(key):
+        # valorant.db also holds the simulator's facts, so it is not restored
+        # wholesale; its dimensions are reloaded from the restored snapshot
+        with StarSchemaLoader() as db:
+            db.load_dimensions(load_dimensions(list(DIMENSION_TABLES)))
+        print(f"API data and code unchanged; restored outputs of run {key[:12]}")
+        return
+
+    if cosmetic_frames is None:
+        cosmetic_frames = {name: client.stream_to_df(path, transformer) for name, (path, transformer) in COSMETICS.items()}
+    df_skins, df_buddies, df_playercards, df_sprays = (cosmetic_frames[name] for name in COSMETICS)
+
+    # 2) Transform JSON → DataFrame using the respective transformer.
+    #    Only records whose content changed since the last run are re-transformed,
+    #    and a dimension CSV is only rewritten when something changed.
+    refresh_counts = {}
+    df_agents, refresh_counts["agents"] = refresh_dimension("agents", agents_json, agents_json_to_df)
+    df_weapons, refresh_counts["weapons"] = refresh_dimension("weapons", weapons_json, weapons_json_to_df)
+    df_weapon_damage_ranges, refresh_counts["weapon_damage_ranges"] = refresh_dimension(
+        "weapon_damage_ranges", weapons_json, weapon_damage_ranges_json_to_df, df_key="weapon_uuid"
+    )
+    df_maps, refresh_counts["maps"] = refresh_dimension("maps", maps_json, maps_json_to_df)
+    df_gamemodes, refresh_counts["gamemodes"] = refresh_dimension("gamemodes", gamemodes_json, gamemodes_json_to_df)
+    df_gears, refresh_counts["gears"] = refresh_dimension("gears", gears_json, gears_json_to_df)
+    df_competitive_tiers, refresh_counts["competitive_tiers"] = refresh_dimension(
+        "competitive_tiers", index_episodes(competitive_tiers_json), competitivetiers_json_to_df
+    )
     df_users = synthetic_users(df_competitive_tiers)
+    df_localized_names = pd.concat(
+        [localized_names_json_to_df(data) for data in localized_json], ignore_index=True
+    )
 
 
     #df_timeline = base_params(df_users, df_agents, df_maps)
 
 
     # 3) Use/inspect/save
+    for name, counts in refresh_counts.items():
+        print(f"{name}: {counts}")
+
     print("Agents:")
     print(df_agents.head())
 
@@ -42,13 +132,52 @@ def main():
     print(df_weapons.head())
 
     # Optionally save
-    df_agents.to_csv("data/agents_dim.csv", index=False)
-    df_weapons.to_csv("data/weapons_dim.csv", index=False)
-    df_maps.to_csv("data/maps_dim.csv", index=False)
-    df_gamemodes.to_csv("data/gamemodes_dim.csv", index=False)
-    df_gears.to_csv("data/gears_dim.csv", index=False)
-    df_competitive_tiers.to_csv("data/competitive_tiers_dim.csv", index=False)
     df_users.to_csv("data/users_dim.csv", index=False)
+    df_localized_names.to_csv("data/localized_names_dim.csv", index=False)
+    df_skins.to_csv("data/skins_dim.csv", index=False)
+    df_buddies.to_csv("data/buddies_dim.csv", index=False)
+    df_playercards.to_csv("data/playercards_dim.csv", index=False)
+    df_sprays.to_csv("data/sprays_dim.csv", index=False)
+
+    # Typed binary snapshot of every dimension; workers read it with load_dimensions()
+    write_snapshot({
+        "agents": df_agents,
+        "weapons": df_weapons,
+        "weapon_damage_ranges": df_weapon_damage_ranges,
+        "maps": df_maps,
+        "gamemodes": df_gamemodes,
+        "gears": df_gears,
+        "competitive_tiers": df_competitive_tiers,
+        "users": df_users,
+        "localized_names": df_localized_names,
+        "skins": df_skins,
+        "buddies": df_buddies,
+        "playercards": df_playercards,
+        "sprays": df_sprays,
+    })
+
+    # Star-schema dimensions for ad-hoc SQL; facts are appended by the simulator
+    with StarSchemaLoader() as db:
+        db.load_dimensions({
+            "users": df_users,
+            "agents": df_agents,
+            "maps": df_maps,
+            "competitive_tiers": df_competitive_tiers,
+        })
+
+    # 4) Cache media locally so reports stop hot-linking the API's CDN
+    AssetDownloader().download_dimensions(
+        {
+            "agents": df_agents,
+            "maps": df_maps,
+            "competitive_tiers": df_competitive_tiers,
+            "gears": df_gears,
+            "weapons": df_weapons,
+        },
+        mapping_path="data/asset_paths_dim.csv",
+    )
+
+    run_cache.store(key, MAIN_OUTPUTS, run_inputs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,170 @@
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_CAREER_DIR = "data/career_stats"
+AGENTS_FILE = "agents.json"
+# column -> dtype; one array per column, indexed by user_id
+CAREER_COLUMNS: Dict[str, np.dtype] = {
+    "matches": np.dtype(np.int32),
+    "rounds": np.dtype(np.int32),
+    "kills": np.dtype(np.int32),
+    "deaths": np.dtype(np.int32),
+    "head_hits": np.dtype(np.float64),
+    "body_hits": np.dtype(np.float64),
+    "leg_hits": np.dtype(np.float64),
+    "plants": np.dtype(np.int32),
+    "defuses": np.dtype(np.int32),
+    "agents_mask": np.dtype(np.uint64),  # bit i set = played agent i of the agent registry
+}
+MAX_AGENTS = 64
+
+
+def _per_user(df: pd.DataFrame, values: Sequence[str]) -> pd.DataFrame:
+    return df.groupby("user_id", observed=True)[list(values)].sum()
+
+
+class CareerStats:
+    """
+    Per-user running career aggregates: matches, rounds, kills, deaths,
+    head/body/leg hits, plants, defuses and agents played. Each column is one
+    numpy array indexed by user_id, so a profile lookup is a handful of array
+    reads whatever the population size, and no fact table is scanned:
+
+        career = CareerStats()
+        generate_all_match_details(users_df, agents_df, maps_df, on_chunk=career.update)
+        career.save()
+
+        career = CareerStats.load()
+        career.profile(42)      # {"matches": ..., "kd": ..., "head_ratio": ..., "agents": [...]}
+
+    Agents played are a 64-bit mask per user over an agent registry kept
+    next to the arrays.
+    """
+
+    def __init__(self, capacity: int = 1024, agents: Optional[List[str]] = None):
+        self._arrays = {name: np.zeros(capacity, dtype=dtype) for name, dtype in CAREER_COLUMNS.items()}
+        self.agents: List[str] = list(agents or [])
+        self._agent_bits = {agent: i for i, agent in enumerate(self.agents)}
+
+    @property
+    def capacity(self) -> int:
+        return len(self._arrays["matches"])
+
+    def _reserve(self, max_user_id: int) -> None:
+        """Grow every array (doubling) so that max_user_id is a valid index."""
+        if max_user_id < self.capacity:
+            return
+        capacity = max(self.capacity, 1)
+        while capacity <= max_user_id:
+            capacity *= 2
+        for name, array in self._arrays.items():
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            self._arrays[name] = grown
+
+    def _agent_bit(self, agent: str) -> int:
+        if agent not in self._agent_bits:
+            if len(self.agents) >= MAX_AGENTS:
+                raise ValueError(f"CareerStats tracks at most {MAX_AGENTS} agents")
+            self._agent_bits[agent] = len(self.agents)
+            self.agents.append(agent)
+        return self._agent_bits[agent]
+
+    def _add(self, name: str, per_user: pd.Series) -> None:
+        # groupby output has unique user ids, so fancy-index += is safe
+        ids = per_user.index.to_numpy(dtype=np.int64)
+        self._arrays[name][ids] += per_user.to_numpy().astype(self._arrays[name].dtype)
+
+    def update(self, chunk: Dict[str, pd.DataFrame]) -> None:
+        """Fold one simulator chunk ({name: DataFrame} from iter_match_details) into the aggregates."""
+        try:
+            players = chunk["match_df"][["match_id", "user_id", "agent_name"]]
+            if players.empty:
+                return
+            self._reserve(int(players["user_id"].max()))
+            users = players[["match_id", "agent_name", "user_id"]]
+
+            self._add("matches", players.groupby("user_id").size())
+            bits = players["agent_name"].astype(str).map(
+                {agent: np.uint64(1) << np.uint64(self._agent_bit(agent)) for agent in players["agent_name"].astype(str).unique()}
+            )
+            masks = pd.Series(bits.to_numpy(dtype=np.uint64), index=players["user_id"]).groupby(level=0).agg(np.bitwise_or.reduce)
+            ids = masks.index.to_numpy(dtype=np.int64)
+            self._arrays["agents_mask"][ids] |= masks.to_numpy(dtype=np.uint64)
+
+            perf = chunk["agent_perf_status"].merge(users, on=["match_id", "agent_name"], how="left", validate="many_to_one")
+            self._add("rounds", perf.groupby("user_id")["round_id"].nunique())
+            hits = _per_user(perf, ["kills", "head_hit", "body_hit", "leg_hit"])
+            self._add("kills", hits["kills"])
+            self._add("head_hits", hits["head_hit"])
+            self._add("body_hits", hits["body_hit"])
+            self._add("leg_hits", hits["leg_hit"])
+            victims = chunk["agent_perf_status"][["match_id", "opponent", "kills"]].merge(
+                users.rename(columns={"agent_name": "opponent"}), on=["match_id", "opponent"], how="left",
+                validate="many_to_one",
+            )
+            self._add("deaths", _per_user(victims, ["kills"])["kills"])
+
+            spikes = chunk["round_spike_status"]
+            for column, name in (("planter", "plants"), ("defuser", "defuses")):
+                events = spikes.loc[spikes[column].notna(), ["match_id", column]].rename(columns={column: "agent_name"})
+                events = events.merge(users, on=["match_id", "agent_name"], how="left", validate="many_to_one")
+                if not events.empty:
+                    self._add(name, events.groupby("user_id").size())
+        except Exception as e:
+            logging.error(f"CareerStats: update failed: {e}")
+            raise CustomException(e, sys)
+
+    def profile(self, user_id: int) -> Dict[str, Any]:
+        """Career of one user in O(1): the raw counters plus kd, hit ratios and the agents played."""
+        known = 0 <= user_id < self.capacity
+        row = {name: array[user_id].item() if known else 0 for name, array in self._arrays.items()}
+        mask = row.pop("agents_mask")
+        hits = row["head_hits"] + row["body_hits"] + row["leg_hits"]
+        row["kd"] = row["kills"] / row["deaths"] if row["deaths"] else float(row["kills"])
+        for part in ("head", "body", "leg"):
+            row[f"{part}_ratio"] = row[f"{part}_hits"] / hits if hits else 0.0
+        row["agents"] = [agent for i, agent in enumerate(self.agents) if mask >> i & 1]
+        return row
+
+    def to_frame(self, user_ids: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """The aggregates of `user_ids` (default: every user with a match) as a DataFrame indexed by user_id."""
+        if user_ids is None:
+            user_ids = np.flatnonzero(self._arrays["matches"])
+        ids = np.asarray(user_ids, dtype=np.int64)
+        df = pd.DataFrame({name: array[ids] for name, array in self._arrays.items()}, index=pd.Index(ids, name="user_id"))
+        hits = df["head_hits"] + df["body_hits"] + df["leg_hits"]
+        df["kd"] = df["kills"] / df["deaths"].replace(0, np.nan)
+        for part in ("head", "body", "leg"):
+            df[f"{part}_ratio"] = df[f"{part}_hits"] / hits.replace(0, np.nan)
+        df["agents_played"] = np.bitwise_count(df["agents_mask"].to_numpy()) if hasattr(np, "bitwise_count") \
+            else [bin(int(mask)).count("1") for mask in df["agents_mask"]]
+        return df
+
+    def save(self, root: str = DEFAULT_CAREER_DIR) -> None:
+        """One `<column>.npy` per array plus agents.json; load(mmap_mode="r") maps them read-only."""
+        os.makedirs(root, exist_ok=True)
+        for name, array in self._arrays.items():
+            np.save(os.path.join(root, f"{name}.tmp.npy"), array)
+            os.replace(os.path.join(root, f"{name}.tmp.npy"), os.path.join(root, f"{name}.npy"))
+        with open(os.path.join(root, AGENTS_FILE), "w", encoding="utf-8") as file:
+            json.dump(self.agents, file)
+        logging.info(f"CareerStats: saved {int(np.count_nonzero(self._arrays['matches']))} users to {root}")
+
+    @classmethod
+    def load(cls, root: str = DEFAULT_CAREER_DIR, mmap_mode: Optional[str] = None) -> "CareerStats":
+        """Load saved aggregates; mmap_mode="r" for read-only lookups without reading the arrays."""
+        agents_path = os.path.join(root, AGENTS_FILE)
+        if not os.path.exists(agents_path):
+            return cls()
+        with open(agents_path, "r", encoding="utf-8") as file:
+            stats = cls(capacity=0, agents=json.load(file))
+        for name in CAREER_COLUMNS:
+            stats._arrays[name] = np.load(os.path.join(root, f"{name}.npy"), mmap_mode=mmap_mode)
+        return stats
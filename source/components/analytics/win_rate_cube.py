@@ -0,0 +1,141 @@
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from source.components.dataStore.arrow_ipc import read_arrow, write_arrow
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_CUBE_PATH = "data/cubes/agent_map_side.arrow"
+CUBE_DIMENSIONS = ("match_date", "map_name", "agent_name", "side")
+CUBE_MEASURES = ("rounds_played", "rounds_won", "kills", "deaths", "damage")
+
+
+def round_agent_stats(chunk: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    One row per (round, agent) of a simulator chunk with the cube's
+    dimensions and measures. `damage` is the damage dealt (the *_hit
+    columns); deaths are the kills credited to the agent's opponents.
+    """
+    perf = chunk["agent_perf_status"]
+    rounds = chunk["round_status"][["round_id", "winning_side"]]
+    matches = chunk["match_df"][["match_id", "match_date", "map_name"]].drop_duplicates("match_id")
+
+    perf = perf.assign(damage=perf["head_hit"] + perf["body_hit"] + perf["leg_hit"])
+    per_agent = perf.groupby(["match_id", "round_id", "agent_name", "isAttacker"], as_index=False, observed=True)[
+        ["kills", "damage"]
+    ].sum()
+    deaths = perf.groupby(["round_id", "opponent"], observed=True)["kills"].sum().rename("deaths")
+    per_agent = per_agent.merge(deaths, left_on=["round_id", "agent_name"], right_index=True, how="left")
+
+    per_agent["side"] = np.where(per_agent["isAttacker"] == 1, "attacker", "defender")
+    per_agent = per_agent.merge(rounds, on="round_id", how="left", validate="many_to_one")
+    per_agent = per_agent.merge(matches, on="match_id", how="left", validate="many_to_one")
+    per_agent["rounds_played"] = 1
+    per_agent["rounds_won"] = (per_agent["winning_side"] == per_agent["side"]).astype(np.int64)
+    per_agent["kills"] = per_agent["kills"].astype(np.int64)
+    per_agent["deaths"] = per_agent["deaths"].fillna(0).astype(np.int64)
+    return per_agent[list(CUBE_DIMENSIONS) + list(CUBE_MEASURES)]
+
+
+class AgentMapSideCube:
+    """
+    Pre-aggregated agent meta: rounds played/won, kills, deaths and damage
+    per (match_date, map_name, agent_name, side). The simulator feeds it
+    chunk by chunk, so questions like "Jett on Ascent as attacker this month"
+    are answered from a few thousand cube cells instead of joining
+    agent_perf_status, round_status and match_status:
+
+        cube = AgentMapSideCube()
+        for chunk in iter_match_details(users_df, agents_df, maps_df):
+            cube.update(chunk)
+        cube.save()
+
+        cube = AgentMapSideCube.load()
+        cube.query(by=["agent_name"], map_name="Ascent", side="attacker",
+                   match_date=("2025-03-01", "2025-03-31"))
+    """
+
+    def __init__(self, cells: Optional[pd.DataFrame] = None):
+        self._cells = cells if cells is not None else pd.DataFrame(columns=list(CUBE_DIMENSIONS) + list(CUBE_MEASURES))
+        self._pending: List[pd.DataFrame] = []
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_CUBE_PATH) -> "AgentMapSideCube":
+        if not os.path.exists(path):
+            return cls()
+        return cls(read_arrow(path))
+
+    def save(self, path: str = DEFAULT_CUBE_PATH) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write_arrow(self.cells, f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+        logging.info(f"AgentMapSideCube: saved {len(self._cells)} cells to {path}")
+
+    def _add(self, chunk: Dict[str, pd.DataFrame], sign: int) -> None:
+        try:
+            stats = round_agent_stats(chunk)
+            delta = stats.groupby(list(CUBE_DIMENSIONS), as_index=False, observed=True)[list(CUBE_MEASURES)].sum()
+            if sign < 0:
+                delta[list(CUBE_MEASURES)] = -delta[list(CUBE_MEASURES)]
+            self._pending.append(delta)
+        except Exception as e:
+            logging.error(f"AgentMapSideCube: update failed: {e}")
+            raise CustomException(e, sys)
+
+    def update(self, chunk: Dict[str, pd.DataFrame]) -> None:
+        """Add a simulator chunk ({name: DataFrame} from iter_match_details)."""
+        self._add(chunk, 1)
+
+    def retract(self, chunk: Dict[str, pd.DataFrame]) -> None:
+        """Subtract a chunk previously added, e.g. before re-simulating its matches."""
+        self._add(chunk, -1)
+
+    @property
+    def cells(self) -> pd.DataFrame:
+        """The cube, one row per non-empty cell; pending chunk deltas are folded in first."""
+        if self._pending:
+            merged = pd.concat([self._cells] + self._pending, ignore_index=True)
+            merged["match_date"] = pd.to_datetime(merged["match_date"])
+            cells = merged.groupby(list(CUBE_DIMENSIONS), as_index=False, observed=True)[list(CUBE_MEASURES)].sum()
+            self._cells = cells[cells["rounds_played"] != 0].reset_index(drop=True)
+            self._pending = []
+        return self._cells
+
+    def query(self, by: Sequence[str] = ("agent_name",), **filters: Any) -> pd.DataFrame:
+        """
+        Roll the cube up to the dimensions in `by` after slicing it with
+        `filters`: a value (`side="attacker"`), a list of values
+        (`map_name=["Ascent", "Bind"]`) or, for match_date, a (start, end)
+        range with inclusive ends. Adds win_rate, kd and damage_per_round.
+        """
+        unknown = [name for name in list(by) + list(filters) if name not in CUBE_DIMENSIONS]
+        if unknown:
+            raise KeyError(f"Unknown cube dimensions {unknown}; expected {list(CUBE_DIMENSIONS)}")
+        cells = self.cells
+        mask = np.ones(len(cells), dtype=bool)
+        for name, value in filters.items():
+            if name == "match_date" and isinstance(value, tuple):
+                start, end = value
+                mask &= (cells["match_date"] >= pd.Timestamp(start)).to_numpy()
+                mask &= (cells["match_date"] <= pd.Timestamp(end)).to_numpy()
+            elif isinstance(value, (list, set)):
+                mask &= cells[name].isin(value).to_numpy()
+            else:
+                mask &= (cells[name] == (pd.Timestamp(value) if name == "match_date" else value)).to_numpy()
+
+        sliced = cells[mask]
+        if by:
+            result = sliced.groupby(list(by), as_index=False, observed=True)[list(CUBE_MEASURES)].sum()
+        else:
+            result = sliced[list(CUBE_MEASURES)].sum().to_frame().T
+        rounds = result["rounds_played"].replace(0, np.nan)
+        result["win_rate"] = result["rounds_won"] / rounds
+        result["kd"] = result["kills"] / result["deaths"].replace(0, np.nan)
+        result["damage_per_round"] = result["damage"] / rounds
+        return result.reset_index(drop=True)
+
+    def win_rate(self, **filters: Any) -> float:
+        """Rounds won / rounds played over a slice, e.g. win_rate(agent_name="Jett", side="attacker")."""
+        return float(self.query(by=(), **filters)["win_rate"].iloc[0])
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import threading
+import pandas as pd
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, Optional
+from source.logger import logging
+
+# Media URL columns carried by each dimension DataFrame
+ASSET_COLUMNS = {
+    "agents": ["displayIcon"],
+    "maps": ["Icon"],
+    "competitive_tiers": ["Icon"],
+    "gears": ["armorImage"],
+    "weapons": ["displayIcon"],
+}
+
+
+class AssetDownloader:
+    """
+    Downloads dimension media into a content-addressed local store:
+    `<cache_dir>/<sha256[:2]>/<sha256><ext>`. `index.json` remembers which
+    URL produced which file, so URLs that are already cached are skipped.
+    """
+
+    def __init__(self, cache_dir: str = "data/assets", max_workers: int = 16, timeout: float = 15):
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "ValorantAnalytics/1.0"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index: Dict[str, str] = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as file:
+                self.index = json.load(file)
+
+    @staticmethod
+    def collect_urls(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Distinct (dimension, uuid, column, url) rows for every media column in
+        ASSET_COLUMNS that is present in `frames`.
+        """
+        parts = []
+        for dimension, df in frames.items():
+            for column in ASSET_COLUMNS.get(dimension, []):
+                if column not in df.columns:
+                    continue
+                part = df[["uuid", column]].rename(columns={column: "url"})
+                part = part[part["url"].notna() & (part["url"] != "")]
+                part.insert(0, "dimension", dimension)
+                part.insert(2, "column", column)
+                parts.append(part)
+        if not parts:
+            return pd.DataFrame(columns=["dimension", "uuid", "column", "url"])
+        return pd.concat(parts, ignore_index=True).drop_duplicates(ignore_index=True)
+
+    def _local_path(self, url: str) -> Optional[str]:
+        path = self.index.get(url)
+        return path if path and os.path.exists(os.path.join(self.cache_dir, path)) else None
+
+    def _fetch(self, url: str) -> Optional[str]:
+        try:
+            resp = self.session.get(url, timeout=self.timeout)
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            logging.warning(f"Asset download failed for {url}: {str(e)}")
+            return None
+
+        digest = hashlib.sha256(resp.content).hexdigest()
+        ext = os.path.splitext(url.split("?", 1)[0])[1].lower() or ".bin"
+        rel_path = os.path.join(digest[:2], digest + ext)
+        full_path = os.path.join(self.cache_dir, rel_path)
+        # identical content from different URLs is stored once
+        if not os.path.exists(full_path):
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            tmp_path = f"{full_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(resp.content)
+            os.replace(tmp_path, full_path)
+
+        with self._lock:
+            self.index[url] = rel_path
+        return rel_path
+
+    def download(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Download every distinct URL not already in the local store, concurrently.
+        Returns {url: path relative to cache_dir, or None if it failed}.
+        """
+        urls = list(dict.fromkeys(urls))
+        paths = {url: self._local_path(url) for url in urls}
+        missing = [url for url, path in paths.items() if path is None]
+        logging.info(f"Assets: {len(urls) - len(missing)} cached, {len(missing)} to download")
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for url, path in zip(missing, pool.map(self._fetch, missing)):
+                    paths[url] = path
+            self._save_index()
+        return paths
+
+    def _save_index(self) -> None:
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self.index, file, indent=0, sort_keys=True)
+        os.replace(tmp_path, self._index_path)
+
+    def download_dimensions(self, frames: Dict[str, pd.DataFrame], mapping_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        Download all media referenced by the dimension frames and return (and
+        optionally write) the uuid -> local_path mapping table.
+        """
+        assets = self.collect_urls(frames)
+        paths = self.download(assets["url"])
+        assets["local_path"] = [
+            os.path.join(self.cache_dir, paths[url]) if paths.get(url) else None
+            for url in assets["url"]
+        ]
+        if mapping_path:
+            assets.to_csv(mapping_path, index=False)
+            logging.info(f"Saved asset mapping to {mapping_path} (shape: {assets.shape})")
+        return assets
@@ -0,0 +1,107 @@
+import asyncio
+import aiohttp
+from typing import Any, Dict, List, Optional, Sequence
+from source.components.apiClient.response_cache import ResponseCache
+from source.components.apiClient.valorant_api_client import (
+    ValorantAPIClient,
+    locale_params,
+    reduce_localized,
+    validate_payload,
+)
+
+class AsyncValorantAPIClient:
+    """
+    asyncio counterpart of ValorantAPIClient with the same get_* surface.
+
+    All requests share one aiohttp connection pool and at most
+    `max_concurrency` are in flight at once. Responses go through the same
+    ResponseCache, so a `cache_dir` written by the sync client is reused as is.
+
+        async with AsyncValorantAPIClient(cache_dir="data/api_cache") as client:
+            agents = await client.get_agents()
+    """
+    BASE_URL = ValorantAPIClient.BASE_URL
+
+    def __init__(
+            self,
+            cache_dir: Optional[str] = None,
+            max_concurrency: int = 12,
+            pool_size: Optional[int] = None,
+            timeout: float = 15):
+        self.cache = ResponseCache(cache_dir)
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size or max_concurrency
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncValorantAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        # created lazily so the pool is bound to the running event loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                headers={"User-Agent": "ValorantAnalytics/1.0", "Accept-Encoding": "gzip, deflate"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Core GET method. Takes `/agents`, `/weapons`, etc.
+        Returns the JSON['data'] list or raises on error.
+        """
+        url = f"{self.BASE_URL}{path}"
+        cached = await asyncio.to_thread(self.cache.get, url, params)
+        if cached is not None:
+            return cached
+
+        session = self._ensure_session()
+        async with self._semaphore:
+            async with session.get(url, params=params) as resp:
+                resp.raise_for_status()
+                payload = await resp.json(content_type=None)
+
+        data = validate_payload(payload, url)
+        await asyncio.to_thread(self.cache.put, url, params, data)
+        return data
+
+    async def get_localized(self, path: str, locales: Sequence[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch `path` for every locale concurrently.
+        See reduce_localized for the shape of the result.
+        """
+        if not locales:
+            return {}
+
+        payloads = await asyncio.gather(*(self._get(path, locale_params(locale)) for locale in locales))
+        return reduce_localized(locales, payloads)
+
+    # Convenience methods per endpoint
+    async def get_agents(self) -> List[Dict[str, Any]]:
+        return await self._get("/agents")
+
+    async def get_weapons(self) -> List[Dict[str, Any]]:
+        return await self._get("/weapons")
+
+    async def get_maps(self) -> List[Dict[str, Any]]:
+        return await self._get("/maps")
+
+    async def get_gamemodes(self) -> List[Dict[str, Any]]:
+        return await self._get("/gamemodes")
+
+    async def get_competitive_tiers(self) -> List[Dict[str, Any]]:
+        return await self._get("/competitivetiers")
+
+    async def get_gears(self) -> List[Dict[str, Any]]:
+        return await self._get("/gear")
@@ -0,0 +1,131 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _StreamReader:
+    """
+    Minimal pull reader over a stream of byte chunks. Only the unparsed tail
+    of the body is kept in memory, never the whole payload.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        try:
+            text = self._text_decoder.decode(next(self._chunks))
+        except StopIteration:
+            self._eof = True
+            text = self._text_decoder.decode(b"", final=True)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at end of stream."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise self.error(f"Expected {char!r}, found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, pulling more chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a number touching the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and isinstance(obj, (int, float)) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_envelope_data(chunks: Iterable[bytes], url: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a `{"status": ..., "data": [...]}` body one at a time.
+    Raises ValueError, like ValorantAPIClient._get, if the envelope is malformed:
+    anything response.json() would reject (trailing commas, non-string keys,
+    text after the closing brace) is rejected here too.
+    """
+    reader = _StreamReader(chunks)
+    found_data = False
+    try:
+        reader.expect("{")
+        while reader.peek() != "}":
+            if reader.peek() != '"':
+                raise reader.error("Expecting property name enclosed in double quotes")
+            key = reader.value()
+            reader.expect(":")
+            if key != "data":
+                value = reader.value()
+                if key == "status" and value != 200:
+                    raise ValueError(f"Unexpected status {value} for {url}")
+            else:
+                if reader.peek() != "[":
+                    raise ValueError(f"Unexpected response format for {url}")
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.peek() == "]":
+                            reader.expect("]")
+                            break
+                        reader.expect(",")
+                        if reader.peek() == "]":
+                            raise reader.error("Trailing comma before ']'")
+                found_data = True
+
+            if reader.peek() == "}":
+                break
+            reader.expect(",")
+            if reader.peek() == "}":
+                raise reader.error("Trailing comma before '}'")
+        reader.expect("}")
+        if reader.peek() != "":
+            raise reader.error("Extra data after the response body")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unexpected response format for {url}: {e}") from e
+
+    if not found_data:
+        raise ValueError(f"Unexpected response format for {url}")
+
+
+def iter_chunks(records: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group a record iterator into lists of at most chunk_size records."""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,57 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class ResponseCache:
+    """
+    Thread-safe cache of `data` lists keyed by URL + query params.
+
+    Entries always live in memory; when `cache_dir` is given they are also
+    written to `<cache_dir>/<sha1>.json` so later runs can skip the network.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self._memory: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return f"{url}?{query}" if query else url
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[List[Dict[str, Any]]]:
+        key = self.key(url, params)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        if not self.cache_dir or not os.path.exists(self._path(key)):
+            return None
+
+        with open(self._path(key), "r", encoding="utf-8") as file:
+            data = json.load(file)["data"]
+        with self._lock:
+            self._memory[key] = data
+        return data
+
+    def put(self, url: str, params: Optional[Dict[str, Any]], data: List[Dict[str, Any]]) -> None:
+        key = self.key(url, params)
+        with self._lock:
+            self._memory[key] = data
+        if not self.cache_dir:
+            return
+
+        # write-then-rename so a concurrent reader never sees a partial file
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"key": key, "data": data}, file)
+        os.replace(tmp_path, path)
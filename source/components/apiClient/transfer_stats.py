@@ -0,0 +1,128 @@
+import json
+import socket
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+# Connection timings are written by the thread that opens the connection and
+# read back by the same thread once its request returns.
+_local = threading.local()
+
+
+def reset_connection_timings() -> None:
+    _local.timings = {"dns_s": 0.0, "connect_s": 0.0, "new_connection": False}
+
+
+def connection_timings() -> Dict[str, Any]:
+    return dict(getattr(_local, "timings", {"dns_s": 0.0, "connect_s": 0.0, "new_connection": False}))
+
+
+class _TimedConnectionMixin:
+    """Splits DNS resolution from TCP/TLS connect for every new connection."""
+
+    def _new_conn(self):
+        timings = getattr(_local, "timings", None)
+        if timings is None:
+            return super()._new_conn()
+
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            # let urllib3 raise its usual NameResolutionError
+            return super()._new_conn()
+        timings["dns_s"] += time.perf_counter() - start
+
+        # connect to the addresses already resolved so DNS is not paid twice,
+        # trying each A/AAAA record in turn like urllib3's create_connection
+        dns_host = self._dns_host
+        error = None
+        try:
+            for address in dict.fromkeys(sockaddr[0] for *_, sockaddr in addresses):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+            raise error
+        finally:
+            self._dns_host = dns_host
+
+    def connect(self):
+        timings = getattr(_local, "timings", None)
+        if timings is None:
+            return super().connect()
+
+        dns_before = timings["dns_s"]
+        start = time.perf_counter()
+        super().connect()
+        timings["new_connection"] = True
+        timings["connect_s"] += time.perf_counter() - start - (timings["dns_s"] - dns_before)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class InstrumentedAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools record DNS/connect timings per request."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class TransferStats:
+    """
+    Thread-safe collector of per-request transfer metrics.
+    """
+
+    def __init__(self):
+        self._requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, **metrics: Any) -> None:
+        with self._lock:
+            self._requests.append(metrics)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            requests = list(self._requests)
+        misses = [r for r in requests if r["cache"] == "miss"]
+        return {
+            "requests": len(requests),
+            "cache_hits": len(requests) - len(misses),
+            "cache_misses": len(misses),
+            "new_connections": sum(1 for r in misses if r["new_connection"]),
+            "retries": sum(r["retries"] for r in misses),
+            "bytes_wire": sum(r["bytes_wire"] for r in misses),
+            "bytes_decoded": sum(r["bytes_decoded"] for r in misses),
+            "dns_s": sum(r["dns_s"] for r in misses),
+            "connect_s": sum(r["connect_s"] for r in misses),
+            "total_s": sum(r["total_s"] for r in misses),
+            "per_request": requests,
+        }
+
+    def dump(self, path: str, summary: Optional[Dict[str, Any]] = None) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(summary or self.summary(), file, indent=2)
@@ -1,29 +1,210 @@
+import time
 import requests
-from typing import Any, Dict, List, Optional
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from urllib3.util.retry import Retry
+from source.components.apiClient.json_stream import iter_chunks, iter_envelope_data
+from source.components.apiClient.response_cache import ResponseCache
+from source.components.apiClient.transfer_stats import (
+    InstrumentedAdapter,
+    TransferStats,
+    connection_timings,
+    reset_connection_timings,
+)
+
+# valorant-api falls back to en-US when no `language` is sent
+DEFAULT_LOCALE = "en-US"
+# Only these fields change between locales; everything else is shared
+LOCALIZED_FIELDS = ("displayName",)
+
+def validate_payload(payload: Any, url: str) -> List[Dict[str, Any]]:
+    """
+    Check the `{"status": ..., "data": [...]}` envelope and return the data list.
+    """
+    # basic validation
+    if not isinstance(payload, dict) or "data" not in payload or not isinstance(payload["data"], list):
+        raise ValueError(f"Unexpected response format for {url}")
+    return payload["data"]
+
+def reduce_localized(locales: Sequence[str], payloads: Sequence[List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Keep the full records for the first locale only; the others are reduced
+    to uuid + LOCALIZED_FIELDS since everything else is identical across locales.
+    """
+    localized = {locales[0]: payloads[0]}
+    for locale, data in zip(locales[1:], payloads[1:]):
+        localized[locale] = [
+            {"uuid": record.get("uuid"), **{field: record.get(field) for field in LOCALIZED_FIELDS}}
+            for record in data
+        ]
+    return localized
+
+def locale_params(locale: str) -> Optional[Dict[str, Any]]:
+    # the default locale shares its cache entry with the plain get_* calls
+    return None if locale == DEFAULT_LOCALE else {"language": locale}
 
 class ValorantAPIClient:
     BASE_URL = "https://valorant-api.com/v1"
 
-    def __init__(self, rate_limit_delay: float = 1.0):
+    def __init__(
+            self,
+            rate_limit_delay: float = 1.0,
+            cache_dir: Optional[str] = None,
+            max_workers: int = 12,
+            pool_connections: int = 4,
+            pool_maxsize: Optional[int] = None,
+            max_retries: int = 3,
+            backoff_factor: float = 0.5,
+            accept_encoding: str = "gzip, deflate",
+            timeout: float = 15):
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "ValorantAnalytics/1.0"})
+        self.session.headers.update({
+            "User-Agent": "ValorantAnalytics/1.0",
+            "Accept-Encoding": accept_encoding,
+            "Connection": "keep-alive",
+        })
+        # one pooled adapter so parallel locale fetches reuse the same connections
+        adapter = InstrumentedAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize or max_workers,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.rate_limit_delay = rate_limit_delay
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = ResponseCache(cache_dir)
+        self._stats = TransferStats()
+
+    def _record(self, url: str, params: Optional[Dict[str, Any]], resp: Optional[requests.Response] = None,
+                start: float = 0.0, bytes_decoded: int = 0) -> None:
+        if resp is None:
+            self._stats.record(
+                url=url, params=params, cache="hit", status=None, new_connection=False,
+                dns_s=0.0, connect_s=0.0, ttfb_s=0.0, total_s=0.0,
+                bytes_wire=0, bytes_decoded=0, retries=0,
+            )
+            return
+
+        retries = resp.raw.retries
+        self._stats.record(
+            url=url,
+            params=params,
+            cache="miss",
+            status=resp.status_code,
+            **connection_timings(),
+            ttfb_s=resp.elapsed.total_seconds(),
+            total_s=time.perf_counter() - start,
+            bytes_wire=resp.raw.tell(),
+            bytes_decoded=bytes_decoded,
+            retries=len(retries.history) if retries else 0,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Transfer metrics for every request made so far: totals plus a
+        `per_request` list (DNS/connect/TTFB/total seconds, bytes on wire vs
+        decoded, cache hit/miss, retries).
+        """
+        return self._stats.summary()
+
+    def dump_stats(self, path: str) -> None:
+        """Write stats() to `path` as JSON."""
+        self._stats.dump(path)
 
-    def _get(self, path: str) -> List[Dict[str, Any]]:
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Core GET method. Takes `/agents`, `/weapons`, etc.
         Returns the JSON['data'] list or raises on error.
         """
         url = f"{self.BASE_URL}{path}"
-        resp = self.session.get(url, timeout=15)
+        cached = self.cache.get(url, params)
+        if cached is not None:
+            self._record(url, params)
+            return cached
+
+        reset_connection_timings()
+        start = time.perf_counter()
+        resp = self.session.get(url, params=params, timeout=self.timeout, stream=True)
         resp.raise_for_status()
+        body = resp.content
         payload = resp.json()
+        self._record(url, params, resp, start, len(body))
+
+        data = validate_payload(payload, url)
+        self.cache.put(url, params, data)
+        return data
+
+    def _stream(self, path: str, params: Optional[Dict[str, Any]] = None, read_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming GET for large endpoints. Yields the JSON['data'] records one at
+        a time while the body is still downloading; bypasses the response cache.
+        """
+        url = f"{self.BASE_URL}{path}"
+        reset_connection_timings()
+        start = time.perf_counter()
+        with self.session.get(url, params=params, timeout=self.timeout, stream=True) as resp:
+            resp.raise_for_status()
+            bytes_decoded = 0
 
-        # basic validation
-        if "data" not in payload or not isinstance(payload["data"], list):
-            raise ValueError(f"Unexpected response format for {url}")
+            def chunks():
+                nonlocal bytes_decoded
+                for chunk in resp.iter_content(chunk_size=read_size):
+                    bytes_decoded += len(chunk)
+                    yield chunk
 
-        return payload["data"]
+            yield from iter_envelope_data(chunks(), url)
+            self._record(url, params, resp, start, bytes_decoded)
+
+    def validator(self, path: str) -> Optional[str]:
+        """
+        ETag (or Last-Modified) of `path` from a HEAD request, so a large
+        endpoint's version can be compared without downloading its body.
+        None when the server sends neither or does not answer HEAD.
+        """
+        resp = self.session.head(f"{self.BASE_URL}{path}", timeout=self.timeout, allow_redirects=True)
+        if not resp.ok:
+            return None
+        return resp.headers.get("ETag") or resp.headers.get("Last-Modified")
+
+    def stream_to_df(
+            self,
+            path: str,
+            transformer: Callable[[List[Dict[str, Any]]], pd.DataFrame],
+            chunk_size: int = 1000) -> pd.DataFrame:
+        """
+        Feed a streamed endpoint to `transformer` chunk_size records at a time,
+        so only one chunk of raw JSON is alive at once.
+        """
+        frames = [transformer(chunk) for chunk in iter_chunks(self._stream(path), chunk_size)]
+        if not frames:
+            return transformer([])
+        df = pd.concat(frames, ignore_index=True)
+        # chunks have their own categories; concat falls back to object, so re-categorize
+        for column in frames[0].select_dtypes("category").columns:
+            df[column] = df[column].astype("category")
+        return df
+
+    def get_localized(self, path: str, locales: Sequence[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch `path` for every locale in parallel over the pooled session.
+        See reduce_localized for the shape of the result.
+        """
+        if not locales:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(locales))) as pool:
+            payloads = list(pool.map(lambda locale: self._get(path, locale_params(locale)), locales))
+
+        return reduce_localized(locales, payloads)
 
     # Convenience methods per endpoint
     def get_agents(self) -> List[Dict[str, Any]]:
@@ -40,6 +221,19 @@ class ValorantAPIClient:
 
     def get_competitive_tiers(self) -> List[Dict[str, Any]]:
         return self._get("/competitivetiers")
-    
+
     def get_gears(self) -> List[Dict[str, Any]]:
         return self._get("/gear")
+
+    # Large cosmetic catalogues are streamed instead of materialized
+    def iter_weapon_skins(self) -> Iterator[Dict[str, Any]]:
+        return self._stream("/weapons/skins")
+
+    def iter_buddies(self) -> Iterator[Dict[str, Any]]:
+        return self._stream("/buddies")
+
+    def iter_playercards(self) -> Iterator[Dict[str, Any]]:
+        return self._stream("/playercards")
+
+    def iter_sprays(self) -> Iterator[Dict[str, Any]]:
+        return self._stream("/sprays")
@@ -0,0 +1,245 @@
+import random
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+# Synthetic payloads shaped like valorant-api.com's `data` arrays. Every
+# generator takes (n_records, rng, missing_rate): with probability
+# `missing_rate` an optional field is dropped or set to null, and list fields
+# (abilities, damageRanges, details, tiers, levels, chromas) have ragged lengths.
+
+ROLES = ["Duelist", "Initiator", "Controller", "Sentinel"]
+FIRE_MODES = [None, "EWeaponFireModeDisplayType::SemiAutomatic", "EWeaponFireModeDisplayType::Burst"]
+GAMEMODE_NAMES = ["Standard", "Deathmatch", "Escalation", "Spike Rush", "Team Deathmatch"]
+SPRAY_CATEGORIES = [None, "EAresSprayCategory::Contextual"]
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _maybe(rng: random.Random, missing_rate: float, value: Any) -> Any:
+    return None if rng.random() < missing_rate else value
+
+
+def _drop_missing(record: Dict[str, Any], rng: random.Random, missing_rate: float, optional: List[str]) -> Dict[str, Any]:
+    """Delete some optional keys entirely, the way older API records omit them."""
+    for key in optional:
+        if rng.random() < missing_rate / 2:
+            record.pop(key, None)
+    return record
+
+
+def agents(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        n_abilities = rng.choice([4, 4, 4, 5, 3, 0])
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": f"Agent {i}",
+            "description": "Synthetic agent",
+            "displayIcon": _maybe(rng, missing_rate, f"https://media.valorant-api.com/agents/{i}/displayicon.png"),
+            "isPlayableCharacter": rng.random() > 0.05,
+            "role": _maybe(rng, missing_rate, {
+                "uuid": _uuid(rng),
+                "displayName": rng.choice(ROLES),
+            }),
+            "abilities": _maybe(rng, missing_rate, [
+                {"slot": slot, "displayName": f"Ability {i}.{slot}"}
+                for slot in ["Ability1", "Ability2", "Grenade", "Ultimate", "Passive"][:n_abilities]
+            ]),
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["role", "abilities", "displayIcon"]))
+    return records
+
+
+def weapons(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        starts = sorted(rng.sample(range(1, 50), rng.choice([0, 1, 2, 3])))
+        bounds = [0] + starts + [rng.choice([50, 80])]
+        damage_ranges = [
+            {
+                "rangeStartMeters": bounds[j],
+                "rangeEndMeters": bounds[j + 1],
+                "headDamage": rng.choice([160.0, 140.5, 95.0, 78.0]),
+                "bodyDamage": rng.choice([40.0, 35.0, 26.0]),
+                "legDamage": rng.choice([34.0, 29.75, 22.1]),
+            }
+            for j in range(len(bounds) - 1)
+        ]
+        weapon_stats = {
+            "fireRate": rng.choice([0.75, 6.25, 10.0, 13.33]),
+            "magazineSize": rng.choice([5, 12, 25, 30, 100]),
+            "runSpeedMultiplier": rng.choice([0.76, 0.9, 1.0]),
+            "equipTimeSeconds": rng.choice([0.75, 1.0, 1.25]),
+            "reloadTimeSeconds": rng.choice([1.5, 2.5, 3.0]),
+            "firstBulletAccuracy": rng.choice([0.1, 0.25, 0.4]),
+            "fireMode": rng.choice(FIRE_MODES),
+            "adsStats": _maybe(rng, missing_rate * 4, {
+                "zoomMultiplier": 1.25,
+                "fireRate": 9.0,
+                "runSpeedMultiplier": 0.76,
+                "burstCount": 1,
+                "firstBulletAccuracy": 0.1,
+            }),
+            "damageRanges": damage_ranges,
+        }
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": f"Weapon {i}",
+            "displayIcon": f"https://media.valorant-api.com/weapons/{i}/displayicon.png",
+            "weaponStats": _maybe(rng, missing_rate, weapon_stats),
+            "shopData": _maybe(rng, missing_rate, {"cost": rng.choice([0, 800, 1600, 2900, 4700])}),
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["weaponStats", "shopData"]))
+    return records
+
+
+def maps(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": f"Map {i}",
+            "displayIcon": _maybe(rng, missing_rate, f"https://media.valorant-api.com/maps/{i}/displayicon.png"),
+            "coordinates": _maybe(rng, missing_rate, f"{rng.randint(0, 90)}°N,{rng.randint(0, 180)}°E"),
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["displayIcon", "coordinates"]))
+    return records
+
+
+def gamemodes(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": rng.choice(GAMEMODE_NAMES),
+            "description": _maybe(rng, missing_rate, f"Game mode {i}"),
+            "duration": _maybe(rng, missing_rate, rng.choice(["30-40 MINS", "7-9 MINS"])),
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["description", "duration"]))
+    return records
+
+
+def gears(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        details = [
+            {"name": "Damage Reduction", "value": "Partial"},
+            {"name": "Damage Absorbtion", "value": rng.choice(["66%", "75%"])},
+            {"name": "Regen Pool", "value": rng.choice(["50", "0"])},
+        ]
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": f"Armor {i}",
+            "description": "Synthetic armor",
+            "displayIcon": f"https://media.valorant-api.com/gear/{i}/displayicon.png",
+            "details": details[:rng.choice([1, 2, 3, 3])],
+            "shopData": _maybe(rng, missing_rate, {"cost": rng.choice([400, 1000])}),
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["details", "shopData"]))
+    return records
+
+
+def competitivetiers(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for e in range(n):
+        tiers = [
+            {
+                "tier": tier,
+                "tierName": "UNRANKED" if tier == 0 else f"TIER {tier}",
+                "largeIcon": _maybe(rng, missing_rate, f"https://media.valorant-api.com/competitivetiers/{e}/{tier}/largeicon.png"),
+            }
+            for tier in range(rng.choice([25, 27]))
+        ]
+        records.append({
+            "uuid": _uuid(rng),
+            "assetObjectName": f"Episode{e}_CompetitiveTierDataTable",
+            "tiers": tiers,
+        })
+    return records
+
+
+def skins(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": f"Skin {i}",
+            "themeUuid": _uuid(rng),
+            "contentTierUuid": _maybe(rng, missing_rate * 4, _uuid(rng)),
+            "displayIcon": _maybe(rng, missing_rate, f"https://media.valorant-api.com/weaponskins/{i}/displayicon.png"),
+            "chromas": [{"uuid": _uuid(rng)} for _ in range(rng.randint(1, 4))],
+            "levels": [{"uuid": _uuid(rng)} for _ in range(rng.randint(1, 5))],
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["contentTierUuid", "chromas", "levels"]))
+    return records
+
+
+def buddies(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": f"Buddy {i}",
+            "isHiddenIfNotOwned": rng.random() < 0.1,
+            "themeUuid": _maybe(rng, missing_rate * 4, _uuid(rng)),
+            "displayIcon": f"https://media.valorant-api.com/buddies/{i}/displayicon.png",
+            "levels": [{"uuid": _uuid(rng)} for _ in range(rng.choice([1, 1, 2]))],
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["themeUuid", "levels"]))
+    return records
+
+
+def playercards(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        base = f"https://media.valorant-api.com/playercards/{i}"
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": f"Card {i}",
+            "isHiddenIfNotOwned": rng.random() < 0.1,
+            "themeUuid": _maybe(rng, missing_rate * 4, _uuid(rng)),
+            "displayIcon": f"{base}/displayicon.png",
+            "smallArt": _maybe(rng, missing_rate, f"{base}/smallart.png"),
+            "wideArt": _maybe(rng, missing_rate, f"{base}/wideart.png"),
+            "largeArt": _maybe(rng, missing_rate, f"{base}/largeart.png"),
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["themeUuid", "smallArt", "wideArt", "largeArt"]))
+    return records
+
+
+def sprays(n: int, rng: random.Random, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    records = []
+    for i in range(n):
+        record = {
+            "uuid": _uuid(rng),
+            "displayName": f"Spray {i}",
+            "category": rng.choice(SPRAY_CATEGORIES),
+            "themeUuid": _maybe(rng, missing_rate * 4, _uuid(rng)),
+            "isNullSpray": False,
+            "hideIfNotOwned": rng.random() < 0.1,
+            "displayIcon": f"https://media.valorant-api.com/sprays/{i}/displayicon.png",
+            "animationGif": _maybe(rng, 0.8, f"https://media.valorant-api.com/sprays/{i}/animation.gif"),
+        }
+        records.append(_drop_missing(record, rng, missing_rate, ["category", "themeUuid", "animationGif"]))
+    return records
+
+
+PAYLOAD_GENERATORS: Dict[str, Callable[[int, random.Random, float], List[Dict[str, Any]]]] = {
+    "agents": agents,
+    "weapons": weapons,
+    "maps": maps,
+    "gamemodes": gamemodes,
+    "gears": gears,
+    "competitivetiers": competitivetiers,
+    "skins": skins,
+    "buddies": buddies,
+    "playercards": playercards,
+    "sprays": sprays,
+}
+
+
+def generate(endpoint: str, n: int, seed: Optional[int] = 0, missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    """n synthetic records for `endpoint` (a key of PAYLOAD_GENERATORS)."""
+    return PAYLOAD_GENERATORS[endpoint](n, random.Random(seed), missing_rate)
@@ -0,0 +1,198 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from source.components.benchmark.synthetic_payloads import generate
+from source.components.jsonToPdTransformer.agents import agents_json_to_df
+from source.components.jsonToPdTransformer.weapons import weapons_json_to_df, weapon_damage_ranges_json_to_df
+from source.components.jsonToPdTransformer.maps import maps_json_to_df
+from source.components.jsonToPdTransformer.gamemodes import gamemodes_json_to_df
+from source.components.jsonToPdTransformer.gears import gears_json_to_df
+from source.components.jsonToPdTransformer.competitivetiers import competitivetiers_json_to_df
+from source.components.jsonToPdTransformer.skins import skins_json_to_df
+from source.components.jsonToPdTransformer.buddies import buddies_json_to_df
+from source.components.jsonToPdTransformer.playercards import playercards_json_to_df
+from source.components.jsonToPdTransformer.sprays import sprays_json_to_df
+from source.logger import logging
+
+DEFAULT_SIZES = (10, 1_000, 100_000, 1_000_000)
+DEFAULT_HISTORY_PATH = "data/benchmarks/transformer_history.json"
+# A run is flagged when records/sec drops below this fraction of the previous run
+REGRESSION_THRESHOLD = 0.8
+
+# name -> (payload endpoint, transformer, max records). Each competitive tier
+# record is a whole episode of ~26 tiers, so it is capped well below the others.
+BENCHMARKS: Dict[str, tuple] = {
+    "agents": ("agents", agents_json_to_df, None),
+    "weapons": ("weapons", weapons_json_to_df, None),
+    "weapon_damage_ranges": ("weapons", weapon_damage_ranges_json_to_df, None),
+    "maps": ("maps", maps_json_to_df, None),
+    "gamemodes": ("gamemodes", gamemodes_json_to_df, None),
+    "gears": ("gears", gears_json_to_df, None),
+    "competitive_tiers": ("competitivetiers", competitivetiers_json_to_df, 40_000),
+    "skins": ("skins", skins_json_to_df, None),
+    "buddies": ("buddies", buddies_json_to_df, None),
+    "playercards": ("playercards", playercards_json_to_df, None),
+    "sprays": ("sprays", sprays_json_to_df, None),
+}
+
+
+def time_transformer(
+        transformer: Callable[[List[Dict[str, Any]]], pd.DataFrame],
+        data: List[Dict[str, Any]],
+        repeats: int = 3) -> Dict[str, Any]:
+    """
+    Best-of-`repeats` wall time of transformer(data), then one extra run under
+    tracemalloc for the peak Python/numpy allocation.
+    """
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        df = transformer(data)
+        timings.append(time.perf_counter() - start)
+        del df
+
+    gc.collect()
+    tracemalloc.start()
+    df = transformer(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "records": len(data),
+        "rows": len(df),
+        "seconds": best,
+        "records_per_sec": len(data) / best if best > 0 else float("inf"),
+        "peak_bytes": peak,
+        "frame_bytes": int(df.memory_usage(deep=True).sum()),
+    }
+
+
+def run_benchmarks(
+        sizes: Sequence[int] = DEFAULT_SIZES,
+        names: Optional[Sequence[str]] = None,
+        repeats: int = 3,
+        seed: int = 0,
+        missing_rate: float = 0.05) -> List[Dict[str, Any]]:
+    """Benchmark every transformer in `names` (default: all of BENCHMARKS) at every size."""
+    results = []
+    for name in names or BENCHMARKS:
+        endpoint, transformer, max_records = BENCHMARKS[name]
+        for size in sizes:
+            if max_records is not None and size > max_records:
+                logging.info(f"benchmark {name}: skipping {size} records (max {max_records})")
+                continue
+            data = generate(endpoint, size, seed=seed, missing_rate=missing_rate)
+            result = {"transformer": name, **time_transformer(transformer, data, repeats)}
+            del data
+            logging.info(f"benchmark {result}")
+            print(
+                f"{name:<22} {size:>9} records  {result['seconds']:9.4f}s  "
+                f"{result['records_per_sec']:>12,.0f} rec/s  peak {result['peak_bytes'] / 2**20:8.1f} MiB"
+            )
+            results.append(result)
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path: str = DEFAULT_HISTORY_PATH) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def append_history(results: List[Dict[str, Any]], path: str = DEFAULT_HISTORY_PATH, **params) -> Dict[str, Any]:
+    """Append one run (results plus environment) to the JSON history file and return it."""
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "params": params,
+        "results": results,
+    }
+    history = load_history(path) + [run]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(history, file, indent=1)
+    os.replace(tmp_path, path)
+    return run
+
+
+def find_regressions(
+        results: List[Dict[str, Any]],
+        history: List[Dict[str, Any]],
+        threshold: float = REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare against the most recent earlier measurement of the same
+    (transformer, records) pair; report those whose throughput fell below
+    `threshold` x the previous one.
+    """
+    previous = {}
+    for run in history:
+        for result in run["results"]:
+            previous[(result["transformer"], result["records"])] = result
+
+    regressions = []
+    for result in results:
+        before = previous.get((result["transformer"], result["records"]))
+        if before and result["records_per_sec"] < threshold * before["records_per_sec"]:
+            regressions.append({
+                "transformer": result["transformer"],
+                "records": result["records"],
+                "before": before["records_per_sec"],
+                "after": result["records_per_sec"],
+            })
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description="Benchmark the JSON -> DataFrame transformers on synthetic payloads.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--transformers", nargs="+", choices=list(BENCHMARKS), default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--missing-rate", type=float, default=0.05)
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH)
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    results = run_benchmarks(args.sizes, args.transformers, args.repeats, args.seed, args.missing_rate)
+    append_history(
+        results, args.history,
+        sizes=args.sizes, repeats=args.repeats, seed=args.seed, missing_rate=args.missing_rate,
+    )
+
+    for regression in find_regressions(results, history):
+        message = (
+            f"REGRESSION {regression['transformer']} @ {regression['records']} records: "
+            f"{regression['before']:,.0f} -> {regression['after']:,.0f} rec/s"
+        )
+        logging.warning(message)
+        print(message)
+    return results
+
+
+if __name__ == "__main__":
+    main()
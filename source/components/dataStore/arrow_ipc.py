@@ -0,0 +1,65 @@
+from typing import Dict, List, Optional
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# Columns the simulator fills with 0/1 or None; a chunk where every value is
+# None would otherwise get Arrow's null type and fix the file schema to it.
+ARROW_TYPE_HINTS: Dict[str, pa.DataType] = {
+    "spike_planted": pa.int8(),
+    "spike_defused": pa.int8(),
+}
+
+
+class ArrowTableWriter:
+    """
+    Appends DataFrame chunks as record batches to one uncompressed Arrow IPC
+    (Feather v2) file. The schema comes from the first chunk, with
+    ARROW_TYPE_HINTS for sometimes-null columns; later chunks are cast to it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._sink: Optional[pa.OSFile] = None
+        self._writer: Optional[pa.ipc.RecordBatchFileWriter] = None
+        self._schema: Optional[pa.Schema] = None
+
+    def _schema_for(self, table: pa.Table) -> pa.Schema:
+        fields = [
+            pa.field(field.name, ARROW_TYPE_HINTS.get(field.name, pa.string() if pa.types.is_null(field.type) else field.type))
+            for field in table.schema
+        ]
+        return pa.schema(fields)
+
+    def write(self, df: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._schema = self._schema_for(table)
+            self._sink = pa.OSFile(self.path, "wb")
+            self._writer = pa.ipc.new_file(self._sink, self._schema)
+        self._writer.write_table(table.select(self._schema.names).cast(self._schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = self._sink = None
+
+
+def write_arrow(df: pd.DataFrame, path: str) -> None:
+    """Write one DataFrame as an uncompressed Feather v2 file (mmap-friendly)."""
+    feather.write_feather(df, path, compression="uncompressed")
+
+
+def open_arrow(path: str, columns: Optional[List[str]] = None) -> pa.Table:
+    """
+    Memory-map an Arrow IPC / Feather v2 file. The returned Table's buffers
+    point into the OS page cache, so several processes opening the same file
+    share one copy and nothing is parsed.
+    """
+    return feather.read_table(path, columns=columns, memory_map=True)
+
+
+def read_arrow(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """open_arrow() converted to pandas; split_blocks skips consolidating columns into 2-D blocks."""
+    return open_arrow(path, columns).to_pandas(split_blocks=True)
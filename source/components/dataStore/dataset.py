@@ -0,0 +1,108 @@
+import os
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from source.components.dataStore.parquet_facts import DEFAULT_FACTS_DIR, FACT_TABLES, fact_dataset
+from source.components.dataStore.snapshot import DEFAULT_SNAPSHOT_DIR, load_manifest
+
+# [("agent_name", "==", "Jett"), ("month", "==", 3)] as in pyarrow.parquet, or a pyarrow expression
+Filters = Union[List[Tuple[str, str, Any]], List[List[Tuple[str, str, Any]]], pc.Expression]
+
+
+def _expression(filters: Optional[Filters]) -> Optional[pc.Expression]:
+    if filters is None or isinstance(filters, pc.Expression):
+        return filters
+    return pq.filters_to_expression(filters)
+
+
+class LazyFrame:
+    """
+    A projection and filter over a stored table that is only read when
+    materialized. Column projection and filters are pushed into the scan:
+    Parquet facts skip partitions (year/month) and row groups by their
+    statistics, and only the selected columns are decoded.
+
+        perf = load_dataset("agent_perf_status", columns=["round_id", "head_damage"],
+                            filters=[("agent_name", "==", "Jett"), ("year", "==", 2025), ("month", "==", 3)])
+        perf.count()
+        df = perf.to_pandas()
+    """
+
+    def __init__(self, dataset: ds.Dataset, columns: Optional[Sequence[str]] = None,
+                 filter: Optional[pc.Expression] = None):
+        self._dataset = dataset
+        self._columns = list(columns) if columns is not None else None
+        self._filter = filter
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns if self._columns is not None else self._dataset.schema.names
+
+    @property
+    def schema(self) -> pa.Schema:
+        return pa.schema([self._dataset.schema.field(name) for name in self.columns])
+
+    def select(self, columns: Sequence[str]) -> "LazyFrame":
+        return LazyFrame(self._dataset, columns, self._filter)
+
+    def where(self, filters: Filters) -> "LazyFrame":
+        """Narrow the rows further; combined with the existing filter by AND."""
+        expression = _expression(filters)
+        combined = expression if self._filter is None else self._filter & expression
+        return LazyFrame(self._dataset, self._columns, combined)
+
+    def _scanner(self, batch_size: int = 128 * 1024) -> ds.Scanner:
+        return self._dataset.scanner(columns=self._columns, filter=self._filter, batch_size=batch_size)
+
+    def count(self) -> int:
+        return self._dataset.count_rows(filter=self._filter)
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        return self._scanner().head(n).to_pandas()
+
+    def iter_batches(self, batch_size: int = 128 * 1024) -> Iterator[pd.DataFrame]:
+        """Materialize chunk by chunk, for tables that do not fit in memory."""
+        for batch in self._scanner(batch_size).to_batches():
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def to_arrow(self) -> pa.Table:
+        return self._scanner().to_table()
+
+    def to_pandas(self) -> pd.DataFrame:
+        return self.to_arrow().to_pandas()
+
+    collect = to_pandas
+
+    def __repr__(self) -> str:
+        return f"LazyFrame(columns={self.columns}, filter={self._filter})"
+
+
+def open_dataset(
+        name: str,
+        facts_dir: str = DEFAULT_FACTS_DIR,
+        snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> ds.Dataset:
+    """pyarrow Dataset for a fact table (partitioned Parquet) or a dimension (snapshot Arrow IPC)."""
+    if name in FACT_TABLES:
+        return fact_dataset(name, facts_dir)
+
+    manifest = load_manifest(snapshot_dir)
+    if manifest is not None and name in manifest["tables"]:
+        return ds.dataset(os.path.join(snapshot_dir, manifest["tables"][name]["file"]), format="ipc")
+    raise KeyError(f"Unknown dataset {name!r}: not a fact table {FACT_TABLES} or a table in {snapshot_dir}")
+
+
+def load_dataset(
+        name: str,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[Filters] = None,
+        facts_dir: str = DEFAULT_FACTS_DIR,
+        snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> LazyFrame:
+    """
+    Lazily open a stored table. Nothing is read until the returned LazyFrame
+    is materialized with to_pandas()/to_arrow()/iter_batches()/head()/count().
+    """
+    return LazyFrame(open_dataset(name, facts_dir, snapshot_dir), columns, _expression(filters))
@@ -0,0 +1,214 @@
+import json
+import os
+import shutil
+import sys
+from typing import Any, Dict, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from source.components.dataStore.arrow_ipc import open_arrow
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_INDEX_DIR = "data/indexes"
+MANIFEST_NAME = "manifest.json"
+INDEX_FILES = ("keys", "offsets", "rows")
+# base match frame written next to the facts (one row per match and player)
+MATCH_PLAYER_COLUMNS = ("match_id", "match_date", "user_id", "agent_id", "agent_name", "map_id", "map_name", "team A")
+# name -> (table the rows point into, key column of that table)
+INDEX_SPECS: Dict[str, Tuple[str, str]] = {
+    "user_matches": ("match_players", "user_id"),
+    "agent_rounds": ("agent_perf_status", "agent_name"),
+    "match_rounds": ("agent_perf_status", "match_id"),
+    "match_round_status": ("round_status", "match_id"),
+    "map_matches": ("match_status", "map_name"),
+    "date_matches": ("match_status", "match_date"),
+}
+
+
+def match_players(match_df: pd.DataFrame) -> pd.DataFrame:
+    """The base match frame of a simulator chunk, reduced to MATCH_PLAYER_COLUMNS."""
+    return match_df[[c for c in MATCH_PLAYER_COLUMNS if c in match_df.columns]]
+
+
+def build_offsets(keys: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Sorted-offset (CSR) index of `keys`: unique sorted `keys`, `rows` (row
+    numbers grouped by key, ascending within a key) and `offsets`, so the rows
+    of keys[i] are rows[offsets[i]:offsets[i + 1]].
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    rows = np.argsort(codes, kind="stable").astype(np.int64)
+    offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=len(uniques)), out=offsets[1:])
+    uniques = np.asarray(uniques)
+    if uniques.dtype == object:
+        uniques = uniques.astype(str)
+    elif np.issubdtype(uniques.dtype, np.datetime64):
+        uniques = uniques.astype("datetime64[D]")
+    return {"keys": uniques, "offsets": offsets, "rows": rows}
+
+
+def reset_indexes(index_dir: str = DEFAULT_INDEX_DIR) -> None:
+    """Delete the indexes, before the tables they point into are rewritten."""
+    shutil.rmtree(index_dir, ignore_errors=True)
+
+
+def _column(table: pa.Table, name: str) -> np.ndarray:
+    values = table.column(name).to_numpy()
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[D]")
+    return values
+
+
+def build_indexes(data_dir: str = "data", index_dir: str = DEFAULT_INDEX_DIR) -> Dict[str, int]:
+    """
+    Build every index in INDEX_SPECS over the Arrow IPC outputs in `data_dir`
+    (`<table>.arrow`, written by the simulator with --arrow) and save each as
+    `<index_dir>/<name>/{keys,offsets,rows}.npy`. match_status rows get their
+    map and date from match_players. Returns {index: distinct keys}.
+    """
+    try:
+        paths = {table: os.path.join(data_dir, f"{table}.arrow") for table, _ in INDEX_SPECS.values()}
+        players = open_arrow(paths["match_players"], ["match_id", "match_date", "map_name"])
+        match_info = players.to_pandas().drop_duplicates("match_id").set_index("match_id")
+
+        built = {}
+        for name, (table_name, key) in INDEX_SPECS.items():
+            if table_name == "match_status":
+                match_ids = open_arrow(paths[table_name], ["match_id"]).column("match_id").to_pandas()
+                keys = match_ids.map(match_info[key]).to_numpy()
+                if key == "match_date":
+                    keys = keys.astype("datetime64[D]")
+            else:
+                keys = _column(open_arrow(paths[table_name], [key]), key)
+            arrays = build_offsets(keys)
+            os.makedirs(os.path.join(index_dir, name), exist_ok=True)
+            for part, array in arrays.items():
+                np.save(os.path.join(index_dir, name, f"{part}.npy"), array)
+            built[name] = len(arrays["keys"])
+
+        manifest = {
+            "data_dir": data_dir,
+            "indexes": {name: {"table": table, "key": key} for name, (table, key) in INDEX_SPECS.items()},
+            # size/mtime of the indexed files, so a stale index is detected on load
+            "sources": {table: [os.path.getsize(path), os.path.getmtime(path)] for table, path in paths.items()},
+        }
+        with open(os.path.join(index_dir, f"{MANIFEST_NAME}.tmp"), "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=1)
+        os.replace(os.path.join(index_dir, f"{MANIFEST_NAME}.tmp"), os.path.join(index_dir, MANIFEST_NAME))
+        logging.info(f"build_indexes: built {built} in {index_dir}")
+        return built
+    except Exception as e:
+        logging.error(f"build_indexes failed: {e}")
+        raise CustomException(e, sys)
+
+
+class MatchIndex:
+    """
+    Drill-down over the stored fact tables through the sorted-offset indexes
+    of build_indexes(). The index arrays and the Arrow files are memory-mapped,
+    so a lookup is a binary search over the distinct keys plus a slice, and
+    only the matching rows are read:
+
+        index = MatchIndex.load()
+        index.player_rounds(42, agent_name="Jett")      # agent_perf_status rows
+        index.map_matches("Ascent")                      # match_status rows
+        index.matches_between("2025-03-01", "2025-03-31")
+    """
+
+    def __init__(self, index_dir: str = DEFAULT_INDEX_DIR, data_dir: Optional[str] = None):
+        with open(os.path.join(index_dir, MANIFEST_NAME), "r", encoding="utf-8") as file:
+            self.manifest = json.load(file)
+        self.index_dir = index_dir
+        self.data_dir = data_dir or self.manifest["data_dir"]
+        self._indexes = {
+            name: {part: np.load(os.path.join(index_dir, name, f"{part}.npy"), mmap_mode="r") for part in INDEX_FILES}
+            for name in self.manifest["indexes"]
+        }
+        self._tables: Dict[str, pa.Table] = {}
+        for table_name, (size, mtime) in self.manifest["sources"].items():
+            path = os.path.join(self.data_dir, f"{table_name}.arrow")
+            if not os.path.exists(path) or os.path.getsize(path) != size or os.path.getmtime(path) != mtime:
+                # row numbers of a stale index point at the wrong rows
+                raise ValueError(f"MatchIndex: {path} changed since the index was built; run build_indexes()")
+
+    @classmethod
+    def load(cls, index_dir: str = DEFAULT_INDEX_DIR, data_dir: Optional[str] = None) -> "MatchIndex":
+        return cls(index_dir, data_dir)
+
+    def _key(self, name: str, value: Any) -> Any:
+        keys = self._indexes[name]["keys"]
+        if np.issubdtype(keys.dtype, np.datetime64):
+            return np.datetime64(pd.Timestamp(value).date(), "D")
+        return value
+
+    def rows(self, name: str, value: Any) -> np.ndarray:
+        """Row numbers of `value` in the index's table (empty if absent); O(log distinct keys)."""
+        index = self._indexes[name]
+        value = self._key(name, value)
+        i = int(np.searchsorted(index["keys"], value))
+        if i == len(index["keys"]) or index["keys"][i] != value:
+            return np.empty(0, dtype=np.int64)
+        return np.asarray(index["rows"][index["offsets"][i]:index["offsets"][i + 1]])
+
+    def rows_of(self, name: str, values: Sequence[Any]) -> np.ndarray:
+        """Row numbers of every key in `values`, in ascending order; one vectorized lookup, absent keys skipped."""
+        index = self._indexes[name]
+        keys = index["keys"]
+        values = np.asarray([self._key(name, value) for value in values])
+        positions = np.searchsorted(keys, values)
+        found = positions < len(keys)
+        found[found] = keys[positions[found]] == values[found]
+        starts = index["offsets"][positions[found]]
+        lengths = index["offsets"][positions[found] + 1] - starts
+        # concatenated ranges [starts[i], starts[i] + lengths[i]) without a Python loop
+        within = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return np.sort(np.asarray(index["rows"][np.repeat(starts, lengths) + within]))
+
+    def range_rows(self, name: str, start: Any, end: Any) -> np.ndarray:
+        """Row numbers of every key in [start, end]; one contiguous slice of the index."""
+        index = self._indexes[name]
+        lo = int(np.searchsorted(index["keys"], self._key(name, start), side="left"))
+        hi = int(np.searchsorted(index["keys"], self._key(name, end), side="right"))
+        return np.sort(np.asarray(index["rows"][index["offsets"][lo]:index["offsets"][hi]]))
+
+    def table(self, name: str) -> pa.Table:
+        if name not in self._tables:
+            self._tables[name] = open_arrow(os.path.join(self.data_dir, f"{name}.arrow"))
+        return self._tables[name]
+
+    def take(self, table: str, rows: np.ndarray, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Materialize only `rows` of a memory-mapped table."""
+        source = self.table(table)
+        if columns is not None:
+            source = source.select(list(columns))
+        return source.take(pa.array(rows, type=pa.int64())).to_pandas()
+
+    def player_matches(self, user_id: int) -> pd.DataFrame:
+        """match_players rows of one user (match, date, agent, map)."""
+        return self.take("match_players", self.rows("user_matches", user_id))
+
+    def player_rounds(self, user_id: int, agent_name: Optional[str] = None) -> pd.DataFrame:
+        """agent_perf_status rows of every round `user_id` played, optionally on one agent."""
+        played = self.player_matches(user_id)
+        if agent_name is not None:
+            played = played[played["agent_name"] == agent_name]
+        # one take over the rounds of all the user's matches, then keep the user's agent in each
+        perf = self.take("agent_perf_status", self.rows_of("match_rounds", played["match_id"].astype(str).tolist()))
+        picks = pd.MultiIndex.from_arrays([played["match_id"].astype(str), played["agent_name"].astype(str)])
+        mine = pd.MultiIndex.from_arrays([perf["match_id"].astype(str), perf["agent_name"].astype(str)]).isin(picks)
+        return perf[mine].reset_index(drop=True)
+
+    def agent_rounds(self, agent_name: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return self.take("agent_perf_status", self.rows("agent_rounds", agent_name), columns)
+
+    def match_rounds(self, match_id: str) -> pd.DataFrame:
+        return self.take("round_status", self.rows("match_round_status", match_id))
+
+    def map_matches(self, map_name: str) -> pd.DataFrame:
+        return self.take("match_status", self.rows("map_matches", map_name))
+
+    def matches_between(self, start: Any, end: Any) -> pd.DataFrame:
+        """match_status rows with match_date in [start, end]."""
+        return self.take("match_status", self.range_rows("date_matches", start, end))
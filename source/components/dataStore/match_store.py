@@ -0,0 +1,347 @@
+import json
+import os
+import shutil
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from source.components.dataStore.stream_sink import SIM_TABLES
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_STORE_DIR = "data/match_store"
+MANIFEST_NAME = "manifest.json"
+MATCHES_FILE = "matches.parquet"
+# compact once this many segments exist; rewrite the base segment too once the
+# newer segments cover this fraction of its matches
+DEFAULT_MAX_SEGMENTS = 8
+DEFAULT_FULL_COMPACTION_RATIO = 0.1
+
+
+def reset_match_store(root: str = DEFAULT_STORE_DIR) -> None:
+    """Delete the store, before a full re-simulation is upserted chunk by chunk."""
+    shutil.rmtree(root, ignore_errors=True)
+
+
+class MatchFactStore:
+    """
+    Upsert/delete store for the simulator's fact tables, keyed by match_id.
+
+    Data lives in immutable segments, `<root>/seg-NNNNNN/<table>.parquet`,
+    plus a `matches.parquet` listing the match_ids the segment supersedes
+    (and whether they were deleted). A match's rows are those of the newest
+    segment that lists it, so upserting or deleting 100 matches writes one
+    small segment and leaves the rest of the store untouched:
+
+        store = MatchFactStore()
+        store.upsert(chunk)                       # {table: DataFrame} with match_id
+        store.delete(["MATCH_000042"])
+        rounds = store.read("round_status", match_ids=["MATCH_000007"])
+        store.close()
+
+    A write becomes visible, for all tables at once, when `manifest.json` is
+    replaced. Once more than `max_segments` segments exist a background thread
+    merges them (compaction) and swaps the manifest again; writes and reads go
+    on meanwhile. Errors raised by compaction are re-raised by the next call.
+    One process owns a store directory at a time.
+    """
+
+    def __init__(
+            self,
+            root: str = DEFAULT_STORE_DIR,
+            tables: Sequence[str] = SIM_TABLES,
+            max_segments: int = DEFAULT_MAX_SEGMENTS,
+            full_compaction_ratio: float = DEFAULT_FULL_COMPACTION_RATIO,
+            compression: str = "zstd"):
+        self.root = root
+        self.tables = tuple(tables)
+        self.max_segments = max_segments
+        self.full_compaction_ratio = full_compaction_ratio
+        self.compression = compression
+
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        os.makedirs(root, exist_ok=True)
+        self._manifest = self._load_manifest()
+        self._remove_orphans()
+
+    def __enter__(self) -> "MatchFactStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # manifest
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.root, MANIFEST_NAME)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        path = self._manifest_path()
+        if not os.path.exists(path):
+            return {"version": 0, "next_segment": 1, "tables": list(self.tables), "segments": []}
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _commit(self, manifest: Dict[str, Any]) -> None:
+        manifest["version"] += 1
+        path = self._manifest_path()
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=1)
+        os.replace(f"{path}.tmp", path)
+        self._manifest = manifest
+
+    def _remove_orphans(self) -> None:
+        """Drop segment directories no manifest refers to (an interrupted write or compaction)."""
+        live = {segment["id"] for segment in self._manifest["segments"]}
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if os.path.isdir(path) and name not in live:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _reserve_segment_id(self) -> str:
+        with self._lock:
+            segment_id = f"seg-{self._manifest['next_segment']:06d}"
+            self._manifest["next_segment"] += 1
+        return segment_id
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._manifest["segments"])
+
+    # segments
+
+    def _segment_path(self, segment_id: str, name: str) -> str:
+        return os.path.join(self.root, segment_id, f"{name}.parquet" if name != "matches" else MATCHES_FILE)
+
+    def _write_segment(self, segment_id: str, matches: pd.DataFrame,
+                       tables: Dict[str, pa.Table]) -> Dict[str, Any]:
+        """Write a segment under a temporary name and rename it into place."""
+        tmp_dir = os.path.join(self.root, f".tmp-{segment_id}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        pq.write_table(pa.Table.from_pandas(matches, preserve_index=False),
+                       os.path.join(tmp_dir, MATCHES_FILE), compression=self.compression)
+        rows = {}
+        for name, table in tables.items():
+            pq.write_table(table, os.path.join(tmp_dir, f"{name}.parquet"), compression=self.compression)
+            rows[name] = table.num_rows
+        os.rename(tmp_dir, os.path.join(self.root, segment_id))
+        return {
+            "id": segment_id,
+            "matches": int((~matches["deleted"]).sum()),
+            "deleted": int(matches["deleted"].sum()),
+            "rows": rows,
+        }
+
+    def _read_matches(self, segment_id: str) -> pd.DataFrame:
+        return pq.read_table(self._segment_path(segment_id, "matches")).to_pandas()
+
+    def _latest(self, segments: List[Dict[str, Any]]) -> pd.DataFrame:
+        """(match_id, deleted, segment) for every match, from the newest segment that lists it."""
+        frames = []
+        for position, segment in enumerate(segments):
+            matches = self._read_matches(segment["id"])
+            matches["segment"] = position
+            frames.append(matches)
+        if not frames:
+            return pd.DataFrame({"match_id": pd.Series(dtype=object), "deleted": pd.Series(dtype=bool),
+                                 "segment": pd.Series(dtype="int64")})
+        return pd.concat(frames, ignore_index=True).drop_duplicates("match_id", keep="last")
+
+    def _read_live(self, segments: List[Dict[str, Any]], name: str,
+                   latest: pd.DataFrame, match_ids: Optional[pa.Array] = None) -> Optional[pa.Table]:
+        """Rows of `name` whose match is current in its segment (and in `match_ids`, if given)."""
+        pieces = []
+        for position, segment in enumerate(segments):
+            if not segment["rows"].get(name):
+                continue
+            current = latest[(latest["segment"] == position) & ~latest["deleted"]]["match_id"]
+            if current.empty:
+                continue
+            wanted = pa.array(current.astype(str).to_numpy())
+            if match_ids is not None:
+                wanted = pc.filter(wanted, pc.is_in(wanted, value_set=match_ids))
+                if len(wanted) == 0:
+                    continue
+            table = pq.read_table(self._segment_path(segment["id"], name),
+                                  filters=[("match_id", "in", wanted.to_pylist())] if match_ids is not None else None)
+            if match_ids is None and len(wanted) < segment["matches"]:
+                table = table.filter(pc.is_in(table["match_id"].cast(pa.string()), value_set=wanted))
+            pieces.append(table)
+        if not pieces:
+            return None
+        return pa.concat_tables(pieces, promote_options="permissive")
+
+    # writes
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _append_segment(self, matches: pd.DataFrame, tables: Dict[str, pa.Table]) -> Dict[str, Any]:
+        self._raise_pending_error()
+        segment = self._write_segment(self._reserve_segment_id(), matches, tables)
+        with self._lock:
+            manifest = dict(self._manifest, segments=self._manifest["segments"] + [segment])
+            self._commit(manifest)
+        self._maybe_compact()
+        return segment
+
+    def upsert(self, tables: Dict[str, pd.DataFrame]) -> int:
+        """
+        Insert or replace every match present in `tables` ({table: DataFrame},
+        e.g. a chunk from iter_match_details). A replaced match keeps only the
+        new rows in every table, so pass all of its tables together.
+        Returns the number of matches written.
+        """
+        try:
+            present = {name: df for name, df in tables.items() if name in self.tables}
+            match_ids = pd.unique(pd.concat([df["match_id"].astype(str) for df in present.values()], ignore_index=True)) \
+                if present else []
+            if len(match_ids) == 0:
+                return 0
+            matches = pd.DataFrame({"match_id": sorted(match_ids), "deleted": False})
+            segment_tables = {
+                name: pa.Table.from_pandas(
+                    df.assign(match_id=df["match_id"].astype(str)).sort_values("match_id", kind="stable"),
+                    preserve_index=False,
+                )
+                for name, df in present.items() if not df.empty
+            }
+            segment = self._append_segment(matches, segment_tables)
+            logging.info(f"MatchFactStore: upserted {len(matches)} matches as {segment['id']}")
+            return len(matches)
+        except CustomException:
+            raise
+        except Exception as e:
+            logging.error(f"MatchFactStore.upsert failed: {e}")
+            raise CustomException(e, sys)
+
+    def delete(self, match_ids: Iterable[str]) -> int:
+        """Delete every row of the given matches from all tables. Returns the number of match_ids."""
+        try:
+            match_ids = sorted(set(map(str, match_ids)))
+            if not match_ids:
+                return 0
+            segment = self._append_segment(pd.DataFrame({"match_id": match_ids, "deleted": True}), {})
+            logging.info(f"MatchFactStore: deleted {len(match_ids)} matches in {segment['id']}")
+            return len(match_ids)
+        except CustomException:
+            raise
+        except Exception as e:
+            logging.error(f"MatchFactStore.delete failed: {e}")
+            raise CustomException(e, sys)
+
+    # reads
+
+    def read(self, name: str, match_ids: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Current rows of one table, optionally only for `match_ids`."""
+        if name not in self.tables:
+            raise KeyError(f"Unknown table {name!r}; expected one of {list(self.tables)}")
+        self._raise_pending_error()
+        wanted = pa.array(sorted(set(map(str, match_ids))), type=pa.string()) if match_ids is not None else None
+        with self._lock:
+            segments = self.segments
+            table = self._read_live(segments, name, self._latest(segments), wanted)
+        return table.to_pandas() if table is not None else pd.DataFrame()
+
+    def read_all(self, match_ids: Optional[Iterable[str]] = None) -> Dict[str, pd.DataFrame]:
+        """A consistent {table: DataFrame} view of every table."""
+        with self._lock:
+            return {name: self.read(name, match_ids) for name in self.tables}
+
+    def match_ids(self) -> List[str]:
+        """Every match currently in the store."""
+        with self._lock:
+            latest = self._latest(self.segments)
+        return sorted(latest.loc[~latest["deleted"], "match_id"].astype(str))
+
+    # compaction
+
+    def _maybe_compact(self) -> None:
+        with self._lock:
+            if len(self._manifest["segments"]) <= self.max_segments:
+                return
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(target=self._compact_in_background,
+                                               name="MatchFactStoreCompaction", daemon=True)
+            self._compactor.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            # writes that landed during a compaction may leave the store over the limit again
+            while len(self.segments) > self.max_segments:
+                if self.compact() is None:
+                    break
+        except BaseException as e:
+            # built here, where the compaction thread's traceback is still available
+            self._error = CustomException(e, sys)
+            logging.error(f"MatchFactStore: compaction failed: {e}")
+
+    def compact(self, full: Optional[bool] = None) -> Optional[str]:
+        """
+        Merge segments into one. A minor compaction merges every segment after
+        the first (the base); a full one also rewrites the base and drops
+        deleted matches. By default the compaction is full once the newer
+        segments cover `full_compaction_ratio` of the base's matches.
+        Returns the id of the merged segment, or None if there was nothing to merge.
+        """
+        with self._compaction_lock:
+            return self._compact(full)
+
+    def _compact(self, full: Optional[bool]) -> Optional[str]:
+        segments = self.segments
+        if full is None:
+            base_matches = segments[0]["matches"] if segments else 0
+            delta_matches = sum(s["matches"] + s["deleted"] for s in segments[1:])
+            full = delta_matches >= self.full_compaction_ratio * base_matches
+        merged = segments if full else segments[1:]
+        if len(merged) < 2:
+            return None
+
+        latest = self._latest(merged)
+        if full:
+            latest = latest[~latest["deleted"]]
+        matches = latest[["match_id", "deleted"]].sort_values("match_id").reset_index(drop=True)
+        tables = {}
+        for name in self.tables:
+            table = self._read_live(merged, name, latest)
+            if table is not None:
+                tables[name] = table.sort_by("match_id")
+        segment = self._write_segment(self._reserve_segment_id(), matches, tables)
+
+        merged_ids = [s["id"] for s in merged]
+        with self._lock:
+            current = self._manifest["segments"]
+            # writers only append, so the merged run is still contiguous
+            start = [s["id"] for s in current].index(merged_ids[0])
+            assert [s["id"] for s in current[start:start + len(merged_ids)]] == merged_ids
+            self._commit(dict(self._manifest, segments=current[:start] + [segment] + current[start + len(merged_ids):]))
+            for segment_id in merged_ids:
+                shutil.rmtree(os.path.join(self.root, segment_id), ignore_errors=True)
+        logging.info(f"MatchFactStore: {'full' if full else 'minor'} compaction of {len(merged)} segments into {segment['id']}")
+        return segment["id"]
+
+    def wait(self) -> None:
+        """Block until background compaction has brought the store within max_segments."""
+        while True:
+            compactor = self._compactor
+            if compactor is not None:
+                compactor.join()
+            self._raise_pending_error()
+            # a write that raced the compactor's last check starts no new one
+            self._maybe_compact()
+            if self._compactor is compactor:
+                return
+
+    def close(self) -> None:
+        self.wait()
@@ -0,0 +1,183 @@
+import os
+import shutil
+import sys
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_FACTS_DIR = "data/facts"
+FACT_TABLES = ("match_status", "round_status", "agent_perf_status", "round_spike_status")
+PARTITION_COLUMNS = ["year", "month"]
+FACT_PARTITIONING = ds.partitioning(pa.schema([("year", pa.int16()), ("month", pa.int8())]), flavor="hive")
+# Repeated string ids are stored as Arrow dictionaries (and read back as categoricals)
+DICTIONARY_COLUMNS = ("match_id", "round_id", "agent_id", "agent_name", "opponent", "map_id", "map_name")
+ROW_GROUP_SIZE = 256 * 1024
+
+
+def match_dates(match_df: pd.DataFrame) -> pd.DataFrame:
+    """(match_id, match_date) for every match of the simulator's base match frame."""
+    return match_df[["match_id", "match_date"]].drop_duplicates("match_id").reset_index(drop=True)
+
+
+def _wide_schema(schema: pa.Schema) -> pa.Schema:
+    """
+    int32 dictionary indices. pandas picks int8 for a chunk's categoricals,
+    which overflows once files covering more than 127 ids are read together.
+    """
+    return pa.schema([
+        field.with_type(pa.dictionary(pa.int32(), field.type.value_type)) if pa.types.is_dictionary(field.type) else field
+        for field in schema
+    ], metadata=schema.metadata)
+
+
+def _wide_dictionaries(table: pa.Table) -> pa.Table:
+    return table.cast(_wide_schema(table.schema))
+
+
+def _prepare(df: pd.DataFrame, dates: pd.DataFrame) -> pa.Table:
+    if "match_date" not in df.columns:
+        df = df.merge(dates, on="match_id", how="left", validate="many_to_one")
+    df = df.copy()
+    df["match_date"] = pd.to_datetime(df["match_date"])
+    df["year"] = df["match_date"].dt.year.astype("int16")
+    df["month"] = df["match_date"].dt.month.astype("int8")
+    for column in DICTIONARY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    # sorted rows give tight min/max statistics per row group
+    sort_columns = [c for c in ("match_date", "match_id", "round_id") if c in df.columns]
+    df = df.sort_values(sort_columns, kind="stable")
+    return _wide_dictionaries(pa.Table.from_pandas(df, preserve_index=False))
+
+
+def write_fact_tables(
+        tables: Dict[str, pd.DataFrame],
+        match_df: pd.DataFrame,
+        root: str = DEFAULT_FACTS_DIR,
+        mode: str = "overwrite",
+        compression: str = "zstd",
+        row_group_size: int = ROW_GROUP_SIZE) -> Dict[str, int]:
+    """
+    Write the simulator's fact tables as Parquet datasets partitioned by
+    match_date year/month: `<root>/<table>/year=2025/month=3/part-*.parquet`.
+
+    Rows get match_date joined in from `match_df` (the base match frame).
+    mode="overwrite" replaces only the partitions present in this write;
+    mode="append" adds new files next to existing ones, e.g. for a new match day.
+
+    Returns {table: rows written}.
+    """
+    if mode not in ("overwrite", "append"):
+        raise ValueError(f"mode must be 'overwrite' or 'append', got {mode!r}")
+    try:
+        dates = match_dates(match_df)
+        written = {}
+        for name, df in tables.items():
+            if df.empty:
+                logging.warning(f"write_fact_tables: {name} is empty, skipping")
+                continue
+            table = _prepare(df, dates)
+            pq.write_to_dataset(
+                table,
+                root_path=os.path.join(root, name),
+                partition_cols=PARTITION_COLUMNS,
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior="delete_matching" if mode == "overwrite" else "overwrite_or_ignore",
+                compression=compression,
+                use_dictionary=True,
+                write_statistics=True,
+                row_group_size=row_group_size,
+            )
+            written[name] = table.num_rows
+            logging.info(f"write_fact_tables: {name} -> {root}/{name} ({table.num_rows} rows, mode={mode})")
+        return written
+    except Exception as e:
+        raise CustomException(e, sys)
+
+
+def reset_fact_tables(root: str = DEFAULT_FACTS_DIR, names: Sequence[str] = FACT_TABLES) -> None:
+    """Delete the given fact datasets, before a full re-simulation is appended chunk by chunk."""
+    for name in names:
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def compact_fact_tables(
+        root: str = DEFAULT_FACTS_DIR,
+        names: Sequence[str] = FACT_TABLES,
+        compression: str = "zstd",
+        row_group_size: int = ROW_GROUP_SIZE) -> Dict[str, int]:
+    """
+    Merge the files of every partition into one, sorted like a single write.
+    A chunked run (mode="append") adds one small file per chunk to each
+    partition; merging restores full-size row groups with tight statistics.
+    Returns {table: files removed}.
+    """
+    try:
+        removed = {}
+        for name in names:
+            removed[name] = 0
+            for partition in partitions(name, root):
+                directory = os.path.join(root, name, partition)
+                files = sorted(os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".parquet"))
+                if len(files) < 2:
+                    continue
+                df = pa.concat_tables(
+                    [_wide_dictionaries(pq.read_table(file)) for file in files], promote_options="permissive"
+                ).to_pandas()
+                sort_columns = [c for c in ("match_date", "match_id", "round_id") if c in df.columns]
+                table = _wide_dictionaries(
+                    pa.Table.from_pandas(df.sort_values(sort_columns, kind="stable"), preserve_index=False)
+                )
+                target = os.path.join(directory, f"part-{uuid.uuid4().hex}-0.parquet")
+                # a dot-prefixed name is invisible to dataset readers until the rename
+                tmp = os.path.join(directory, f".{os.path.basename(target)}.tmp")
+                pq.write_table(table, tmp, compression=compression, use_dictionary=True,
+                               write_statistics=True, row_group_size=row_group_size)
+                os.replace(tmp, target)
+                for file in files:
+                    os.remove(file)
+                removed[name] += len(files) - 1
+        logging.info(f"compact_fact_tables: merged partitions in {root}, files removed {removed}")
+        return removed
+    except Exception as e:
+        raise CustomException(e, sys)
+
+
+def read_fact_table(
+        name: str,
+        root: str = DEFAULT_FACTS_DIR,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple[str, str, Any]]] = None) -> pd.DataFrame:
+    """
+    Read one fact table. Filters on year/month prune whole partitions and
+    filters on other columns skip row groups by their statistics:
+
+        read_fact_table("agent_perf_status", filters=[("year", "==", 2025), ("month", "==", 3)])
+    """
+    return pq.read_table(
+        os.path.join(root, name), columns=columns, filters=filters, partitioning=FACT_PARTITIONING,
+        schema=fact_dataset(name, root).schema,
+    ).to_pandas()
+
+
+def fact_dataset(name: str, root: str = DEFAULT_FACTS_DIR) -> ds.Dataset:
+    """pyarrow Dataset over one fact table, for scanners that want batches."""
+    path = os.path.join(root, name)
+    # the inferred schema comes from one file; widen its dictionaries so every file fits
+    schema = _wide_schema(ds.dataset(path, format="parquet", partitioning=FACT_PARTITIONING).schema)
+    return ds.dataset(path, schema=schema, format="parquet", partitioning=FACT_PARTITIONING)
+
+
+def partitions(name: str, root: str = DEFAULT_FACTS_DIR) -> Sequence[str]:
+    """Relative partition directories of a fact table, e.g. ['year=2025/month=1', ...]."""
+    base = os.path.join(root, name)
+    return sorted(
+        os.path.relpath(directory, base)
+        for directory, _, files in os.walk(base)
+        if any(file.endswith(".parquet") for file in files)
+    )
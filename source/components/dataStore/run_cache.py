@@ -0,0 +1,177 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+DEFAULT_RUNS_DIR = "data/runs"
+DEFAULT_KEEP_RUNS = 5
+MANIFEST_NAME = "manifest.json"
+_CHUNK = 1 << 20
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file, or of every file under a directory (relative paths included)."""
+    digest = hashlib.sha256()
+    paths = [path] if os.path.isfile(path) else sorted(
+        os.path.join(directory, file) for directory, _, files in os.walk(path) for file in files
+    )
+    for file_path in paths:
+        digest.update(os.path.relpath(file_path, path).encode("utf-8"))
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(_CHUNK), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def code_version(root: str = "source", pattern: str = "**/*.py", extra: Sequence[str] = ("main.py",)) -> str:
+    """sha256 over the project's Python sources plus the `extra` entry scripts; any code change gives a new run key."""
+    digest = hashlib.sha256()
+    paths = sorted(glob.glob(os.path.join(root, pattern), recursive=True)) + [path for path in extra if os.path.isfile(path)]
+    for path in paths:
+        digest.update(path.replace(os.sep, "/").encode("utf-8"))
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def run_key(inputs: Dict[str, Any]) -> str:
+    """Content address of a run: sha256 of its canonical JSON inputs."""
+    canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RunCache:
+    """
+    Stores a run's output files under `<root>/<key>/`, where key = run_key(inputs),
+    so a later run with identical inputs restores them instead of recomputing:
+
+        cache = RunCache()
+        key = run_key({"snapshot": file_digest("data/snapshot"), "params": params, "code": code_version()})
+        if not cache.restore(key):
+            ...compute and write outputs...
+            cache.store(key, ["data/match_status.csv", "data/facts"], inputs)
+
+    The manifest is written last, so an interrupted store is never reused.
+    gc() keeps the `keep` most recently used runs and drops older ones.
+    """
+
+    def __init__(self, root: str = DEFAULT_RUNS_DIR, keep: int = DEFAULT_KEEP_RUNS,
+                 max_bytes: Optional[int] = None):
+        self.root = root
+        self.keep = keep
+        self.max_bytes = max_bytes
+
+    def _run_dir(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def _manifest_path(self, key: str) -> str:
+        return os.path.join(self._run_dir(key), MANIFEST_NAME)
+
+    def manifest(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._manifest_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_manifest(self, key: str, manifest: Dict[str, Any]) -> None:
+        path = self._manifest_path(key)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=1, default=str)
+        os.replace(f"{path}.tmp", path)
+
+    def store(self, key: str, outputs: Iterable[str], inputs: Optional[Dict[str, Any]] = None) -> str:
+        """Copy `outputs` (files or directories, relative to the working directory) into the run."""
+        run_dir = self._run_dir(key)
+        shutil.rmtree(run_dir, ignore_errors=True)
+        os.makedirs(run_dir)
+        stored = []
+        for output in outputs:
+            if not os.path.exists(output):
+                continue
+            target = os.path.join(run_dir, "outputs", output)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if os.path.isdir(output):
+                shutil.copytree(output, target)
+            else:
+                shutil.copy2(output, target)
+            stored.append(output)
+
+        now = time.time()
+        self._write_manifest(key, {
+            "key": key,
+            "inputs": inputs or {},
+            "outputs": stored,
+            "created_at": datetime.fromtimestamp(now).isoformat(timespec="seconds"),
+            "last_used": now,
+        })
+        self.gc()
+        return run_dir
+
+    def restore(self, key: str, clean: Iterable[str] = ()) -> bool:
+        """
+        Copy a stored run's outputs back into place; False when there is no
+        complete run for `key`. Paths in `clean` that the run did not store are
+        deleted first, so outputs of a differently configured run (other
+        formats, other keys) do not linger next to the restored ones.
+        """
+        manifest = self.manifest(key)
+        if manifest is None:
+            return False
+        for path in set(clean) - set(manifest["outputs"]):
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.exists(path):
+                os.remove(path)
+        outputs_dir = os.path.join(self._run_dir(key), "outputs")
+        for output in manifest["outputs"]:
+            source = os.path.join(outputs_dir, output)
+            if os.path.isdir(source):
+                shutil.rmtree(output, ignore_errors=True)
+                shutil.copytree(source, output)
+            else:
+                os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+                shutil.copy2(source, output)
+        manifest["last_used"] = time.time()
+        self._write_manifest(key, manifest)
+        return True
+
+    def runs(self) -> List[Dict[str, Any]]:
+        """Manifests of complete runs, most recently used first."""
+        if not os.path.isdir(self.root):
+            return []
+        manifests = [self.manifest(key) for key in os.listdir(self.root)]
+        return sorted((m for m in manifests if m is not None), key=lambda m: m["last_used"], reverse=True)
+
+    def gc(self) -> List[str]:
+        """
+        Delete runs beyond the `keep` most recently used, then the least
+        recently used ones until the total size fits `max_bytes`, plus any
+        directory without a manifest (an interrupted store). Returns removed keys.
+        """
+        if not os.path.isdir(self.root):
+            return []
+        complete = self.runs()
+        complete_keys = {m["key"] for m in complete}
+        removed = [key for key in os.listdir(self.root) if key not in complete_keys]
+        removed += [m["key"] for m in complete[self.keep:]]
+        kept = complete[:self.keep]
+
+        if self.max_bytes is not None:
+            sizes = {m["key"]: self._size(m["key"]) for m in kept}
+            while kept and sum(sizes[m["key"]] for m in kept) > self.max_bytes:
+                removed.append(kept.pop()["key"])
+
+        for key in removed:
+            shutil.rmtree(self._run_dir(key), ignore_errors=True)
+        return removed
+
+    def _size(self, key: str) -> int:
+        return sum(
+            os.path.getsize(os.path.join(directory, file))
+            for directory, _, files in os.walk(self._run_dir(key)) for file in files
+        )
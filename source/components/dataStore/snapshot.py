@@ -0,0 +1,104 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+import pandas as pd
+import pyarrow as pa
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_SNAPSHOT_DIR = "data/snapshot"
+MANIFEST_NAME = "manifest.json"
+SNAPSHOT_VERSION = 1
+
+
+def _table_path(snapshot_dir: str, name: str) -> str:
+    return os.path.join(snapshot_dir, f"{name}.arrow")
+
+
+def write_snapshot(frames: Dict[str, pd.DataFrame], snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> Dict[str, dict]:
+    """
+    Write every dimension frame as an uncompressed Arrow IPC file plus one
+    manifest.json describing them. Dtypes (categories, nullable ints,
+    datetimes) travel in the Arrow schema, so readers skip CSV parsing and
+    type inference. Files are replaced atomically and the manifest is written
+    last, so a reader never sees a half-written snapshot.
+    """
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        tables = {}
+        for name, df in frames.items():
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            path = _table_path(snapshot_dir, name)
+            tmp_path = f"{path}.tmp"
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+            tables[name] = {
+                "file": os.path.basename(path),
+                "rows": table.num_rows,
+                "columns": {field.name: str(field.type) for field in table.schema},
+                "bytes": os.path.getsize(path),
+            }
+
+        manifest = {
+            "version": SNAPSHOT_VERSION,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "tables": tables,
+        }
+        manifest_path = os.path.join(snapshot_dir, MANIFEST_NAME)
+        with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=1)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+        logging.info(f"Wrote dimension snapshot to {snapshot_dir}: {sorted(tables)}")
+        return tables
+    except Exception as e:
+        raise CustomException(e, sys)
+
+
+def load_manifest(snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> Optional[dict]:
+    path = os.path.join(snapshot_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def read_table(path: str, memory_map: bool = True) -> pa.Table:
+    """Read one Arrow IPC file; with memory_map the buffers point into the page cache."""
+    source = pa.memory_map(path, "r") if memory_map else pa.OSFile(path, "rb")
+    return pa.ipc.open_file(source).read_all()
+
+
+def load_dimensions(
+        names: Optional[Iterable[str]] = None,
+        snapshot_dir: str = DEFAULT_SNAPSHOT_DIR,
+        memory_map: bool = True,
+        as_arrow: bool = False) -> Dict[str, pd.DataFrame]:
+    """
+    Load the dimension tables written by write_snapshot, typed as they were
+    written. Pass `names` to load a subset; as_arrow=True returns the
+    (zero-copy, memory-mapped) pyarrow Tables instead of DataFrames.
+
+        dims = load_dimensions(["users", "agents", "maps"])
+        users_df = dims["users"]
+    """
+    manifest = load_manifest(snapshot_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No dimension snapshot in {snapshot_dir}; run main.py first")
+
+    names = list(manifest["tables"]) if names is None else list(names)
+    missing = [name for name in names if name not in manifest["tables"]]
+    if missing:
+        raise KeyError(f"Tables not in snapshot {snapshot_dir}: {missing}")
+
+    start = time.perf_counter()
+    frames = {}
+    for name in names:
+        table = read_table(os.path.join(snapshot_dir, manifest["tables"][name]["file"]), memory_map)
+        frames[name] = table if as_arrow else table.to_pandas()
+    logging.info(f"Loaded {len(frames)} dimension tables from {snapshot_dir} in {time.perf_counter() - start:.4f}s")
+    return frames
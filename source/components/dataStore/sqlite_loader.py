@@ -0,0 +1,202 @@
+import sqlite3
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import pandas as pd
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_DB_PATH = "data/valorant.db"
+BATCH_SIZE = 50_000
+
+# table -> (columns, primary key). Columns not present in a frame are stored as NULL.
+DIMENSION_TABLES: Dict[str, Tuple[Dict[str, str], Sequence[str]]] = {
+    "users": (
+        {"user_id": "INTEGER", "username": "TEXT", "tagline": "TEXT", "join_date": "TEXT",
+         "rank_tier_uuid": "TEXT", "rank_tier": "INTEGER"},
+        ("user_id",),
+    ),
+    "agents": (
+        {"uuid": "TEXT", "name": "TEXT", "role": "TEXT", "isPlayable": "INTEGER", "abilitiesCount": "INTEGER",
+         "ability1": "TEXT", "ability2": "TEXT", "ability3": "TEXT", "Ultimate": "TEXT", "displayIcon": "TEXT"},
+        ("uuid",),
+    ),
+    "maps": (
+        {"uuid": "TEXT", "name": "TEXT", "Icon": "TEXT"},
+        ("uuid",),
+    ),
+    "competitive_tiers": (
+        {"episode_idx": "INTEGER", "tier": "INTEGER", "uuid": "TEXT", "Episode": "TEXT", "Rank": "TEXT", "Icon": "TEXT"},
+        ("episode_idx", "tier"),
+    ),
+}
+
+FACT_TABLES: Dict[str, Tuple[Dict[str, str], Sequence[str]]] = {
+    # one row per (match, player), from the simulator's base match frame
+    "match_players": (
+        {"match_id": "TEXT", "match_date": "TEXT", "user_id": "INTEGER", "agent_id": "TEXT", "agent_name": "TEXT",
+         "map_id": "TEXT", "team_a": "INTEGER"},
+        ("match_id", "user_id"),
+    ),
+    "match_status": (
+        {"match_id": "TEXT", "match_date": "TEXT", "map_id": "TEXT",
+         "attacker_round_wins": "INTEGER", "defender_round_wins": "INTEGER"},
+        ("match_id",),
+    ),
+    "round_status": (
+        {"match_id": "TEXT", "round_id": "TEXT", "match_date": "TEXT", "total_round_duration": "REAL",
+         "winning_side": "TEXT"},
+        ("round_id",),
+    ),
+    "agent_perf_status": (
+        {"match_id": "TEXT", "round_id": "TEXT", "match_date": "TEXT", "agent_name": "TEXT", "isAttacker": "INTEGER",
+         "isDefender": "INTEGER", "opponent": "TEXT", "head_hit": "REAL", "body_hit": "REAL", "leg_hit": "REAL",
+         "head_damage": "REAL", "body_damage": "REAL", "leg_damage": "REAL", "kills": "INTEGER"},
+        ("round_id", "agent_name", "opponent"),
+    ),
+    "round_spike_status": (
+        {"match_id": "TEXT", "round_id": "TEXT", "match_date": "TEXT", "spike_planted": "INTEGER", "spike_defused": "INTEGER",
+         "planter": "TEXT", "defuser": "TEXT"},
+        ("round_id",),
+    ),
+}
+
+# (table, column) pairs that get a secondary index
+INDEXES = [
+    ("match_players", "user_id"), ("match_players", "match_date"), ("match_players", "agent_id"),
+    ("match_status", "match_date"), ("match_status", "map_id"),
+    ("round_status", "match_id"), ("round_status", "match_date"),
+    ("agent_perf_status", "match_id"), ("agent_perf_status", "match_date"), ("agent_perf_status", "agent_name"),
+    ("round_spike_status", "match_id"), ("round_spike_status", "match_date"),
+    ("users", "join_date"),
+]
+
+
+def _rows(df: pd.DataFrame, columns: Iterable[str]) -> List[tuple]:
+    """DataFrame -> list of tuples of plain Python values (dates as ISO text, NA as None)."""
+    values = []
+    for column in columns:
+        if column not in df.columns:
+            values.append([None] * len(df))
+            continue
+        series = df[column]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.dt.strftime("%Y-%m-%d")
+        series = series.astype(object)
+        values.append(series.where(series.notna(), None).tolist())
+    return list(zip(*values))
+
+
+class StarSchemaLoader:
+    """
+    Loads the API dimensions and the simulator facts into one SQLite file:
+
+        with StarSchemaLoader() as db:
+            db.load_dimensions({"users": df_users, "agents": df_agents, ...})
+            db.append_facts({"match_status": match_status, ...}, match_df)
+            db.query("SELECT agent_name, SUM(head_damage) FROM agent_perf_status GROUP BY 1")
+
+    Inserts run in batches of BATCH_SIZE inside one transaction per call, and
+    facts are upserted on their primary keys so re-loading a match day is a no-op.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, batch_size: int = BATCH_SIZE):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.create_schema()
+
+    def __enter__(self) -> "StarSchemaLoader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def create_schema(self) -> None:
+        with self.conn:
+            for name, (columns, primary_key) in {**DIMENSION_TABLES, **FACT_TABLES}.items():
+                column_sql = ", ".join(f'"{column}" {sql_type}' for column, sql_type in columns.items())
+                key_sql = ", ".join(f'"{column}"' for column in primary_key)
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS "{name}" ({column_sql}, PRIMARY KEY ({key_sql}))')
+                # databases created before a column was added get it as a nullable column
+                existing = {row[1] for row in self.conn.execute(f'PRAGMA table_info("{name}")')}
+                for column, sql_type in columns.items():
+                    if column not in existing:
+                        self.conn.execute(f'ALTER TABLE "{name}" ADD COLUMN "{column}" {sql_type}')
+            for table, column in INDEXES:
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS "ix_{table}_{column}" ON "{table}" ("{column}")')
+
+    def _insert(self, name: str, columns: Sequence[str], df: pd.DataFrame) -> int:
+        placeholders = ", ".join("?" for _ in columns)
+        column_sql = ", ".join(f'"{column}"' for column in columns)
+        sql = f'INSERT OR REPLACE INTO "{name}" ({column_sql}) VALUES ({placeholders})'
+        for start in range(0, len(df), self.batch_size):
+            self.conn.executemany(sql, _rows(df.iloc[start:start + self.batch_size], columns))
+        return len(df)
+
+    def load_dimensions(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+        """Replace the contents of each dimension table in `frames`."""
+        try:
+            loaded = {}
+            start = time.perf_counter()
+            with self.conn:
+                for name, df in frames.items():
+                    columns, _ = DIMENSION_TABLES[name]
+                    self.conn.execute(f'DELETE FROM "{name}"')
+                    loaded[name] = self._insert(name, list(columns), df)
+            logging.info(f"StarSchemaLoader: loaded dimensions {loaded} in {time.perf_counter() - start:.2f}s")
+            return loaded
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def append_facts(self, tables: Dict[str, pd.DataFrame], match_df: pd.DataFrame) -> Dict[str, int]:
+        """
+        Upsert the simulator outputs. `match_df` is the base match frame; it
+        provides match_players and the match_date/map_id carried onto every fact.
+        """
+        try:
+            match_info = match_df.drop_duplicates("match_id")[["match_id", "match_date", "map_id"]]
+            players = match_df.rename(columns={"team A": "team_a"})
+            frames = {"match_players": players, **tables}
+
+            loaded = {}
+            start = time.perf_counter()
+            with self.conn:
+                for name, df in frames.items():
+                    columns, _ = FACT_TABLES[name]
+                    missing = [c for c in ("match_date", "map_id") if c in columns and c not in df.columns]
+                    if missing:
+                        df = df.merge(match_info[["match_id"] + missing], on="match_id", how="left")
+                    loaded[name] = self._insert(name, list(columns), df)
+            logging.info(f"StarSchemaLoader: appended facts {loaded} in {time.perf_counter() - start:.2f}s")
+            return loaded
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def reset_facts(self) -> None:
+        """Empty every fact table, before a full re-simulation is appended chunk by chunk."""
+        with self.conn:
+            for name in FACT_TABLES:
+                self.conn.execute(f'DELETE FROM "{name}"')
+
+    def delete_matches(self, match_ids: Iterable[str]) -> None:
+        """Remove every fact row of the given matches."""
+        match_ids = [(match_id,) for match_id in match_ids]
+        with self.conn:
+            for name in FACT_TABLES:
+                self.conn.executemany(f'DELETE FROM "{name}" WHERE match_id = ?', match_ids)
+
+    def query(self, sql: str, params: Optional[Sequence[Any]] = None) -> pd.DataFrame:
+        cursor = self.conn.execute(sql, params or ())
+        columns = [description[0] for description in cursor.description]
+        return pd.DataFrame(cursor.fetchall(), columns=columns)
+
+    def analyze(self) -> None:
+        """Refresh the query planner's statistics after large loads."""
+        self.conn.execute("ANALYZE")
@@ -0,0 +1,174 @@
+import gzip
+import io
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Dict, IO, List, Optional, Sequence, Union
+import pandas as pd
+from source.components.dataStore.arrow_ipc import ArrowTableWriter
+from source.exceptions import CustomException
+from source.logger import logging
+
+SIM_TABLES = ("match_status", "round_status", "agent_perf_status", "round_spike_status")
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+FORMATS = ("csv", "arrow")
+_STOP = object()
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("compression='zstd' needs the zstandard package (pip install zstandard)") from e
+    return zstandard
+
+
+def sink_paths(out_dir: str = "data", tables: Sequence[str] = SIM_TABLES) -> List[str]:
+    """Every file a sink can write for `tables`, across formats and compressions."""
+    suffixes = [f".csv{suffix}" for suffix in COMPRESSION_SUFFIXES.values()] + [".arrow"]
+    return [os.path.join(out_dir, f"{name}{suffix}") for name in tables for suffix in suffixes]
+
+
+def reset_sink_outputs(out_dir: str = "data", tables: Sequence[str] = SIM_TABLES) -> None:
+    """Delete the files of `tables` in every format, so a run in another format leaves none behind."""
+    for path in sink_paths(out_dir, tables):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _open_text(path: str, compression: Optional[str], level: Optional[int]) -> IO[str]:
+    if compression is None:
+        return open(path, "w", encoding="utf-8", newline="")
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=6 if level is None else level)
+    if compression == "zstd":
+        raw = _zstandard().ZstdCompressor(level=3 if level is None else level).stream_writer(open(path, "wb"))
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    raise ValueError(f"Unknown compression {compression!r}; expected one of {list(COMPRESSION_SUFFIXES)}")
+
+
+class _CsvTableWriter:
+    def __init__(self, path: str, compression: Optional[str], level: Optional[int]):
+        self._handle = _open_text(path, compression, level)
+        self._header = True
+
+    def write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._handle, header=self._header, index=False)
+        self._header = False
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class FactStreamSink:
+    """
+    Writes simulator chunks to `<out_dir>/<table>.csv[.gz|.zst]`, or with
+    format="arrow" to uncompressed, memory-mappable `<table>.arrow` files, as
+    they are produced. write() hands the chunk to a background thread through a
+    bounded queue, so CSV formatting and compression overlap with the
+    simulation and at most `max_pending` chunks are held in memory:
+
+        with FactStreamSink("data", compression="gzip") as sink:
+            for chunk in iter_match_details(users_df, agents_df, maps_df):
+                sink.write(chunk)
+
+    CSV headers are written with the first chunk of each table. Errors raised
+    on the writer thread are re-raised by the next write() or close().
+    """
+
+    def __init__(
+            self,
+            out_dir: str = "data",
+            tables: Sequence[str] = SIM_TABLES,
+            compression: Optional[str] = None,
+            compresslevel: Optional[int] = None,
+            max_pending: int = 4,
+            format: str = "csv"):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}; expected one of {list(FORMATS)}")
+        if format == "arrow" and compression is not None:
+            raise ValueError("format='arrow' is written uncompressed so it can be memory-mapped")
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression {compression!r}; expected one of {list(COMPRESSION_SUFFIXES)}")
+        if compression == "zstd":
+            _zstandard()  # fail here rather than on the writer thread
+        os.makedirs(out_dir, exist_ok=True)
+        self.tables = tuple(tables)
+        suffix = ".arrow" if format == "arrow" else f".csv{COMPRESSION_SUFFIXES[compression]}"
+        self.paths = {name: os.path.join(out_dir, f"{name}{suffix}") for name in self.tables}
+        self.format = format
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self.rows = {name: 0 for name in self.tables}
+        self.write_seconds = 0.0
+
+        self._writers: Dict[str, Union[_CsvTableWriter, ArrowTableWriter]] = {}
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="FactStreamSink", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "FactStreamSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def write(self, chunk: Dict[str, pd.DataFrame]) -> None:
+        """Queue one chunk ({table: DataFrame}); blocks while max_pending chunks are waiting."""
+        if self._closed:
+            raise ValueError("FactStreamSink is closed")
+        self._raise_pending_error()
+        self._queue.put({name: chunk[name] for name in self.tables if name in chunk})
+
+    def _write_chunk(self, chunk: Dict[str, pd.DataFrame]) -> None:
+        start = time.perf_counter()
+        for name, df in chunk.items():
+            if df.empty:
+                continue
+            if name not in self._writers:
+                self._writers[name] = (
+                    ArrowTableWriter(self.paths[name]) if self.format == "arrow"
+                    else _CsvTableWriter(self.paths[name], self.compression, self.compresslevel)
+                )
+            self._writers[name].write(df)
+            self.rows[name] += len(df)
+        self.write_seconds += time.perf_counter() - start
+
+    def _run(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is _STOP:
+                    return
+                if self._error is None:
+                    self._write_chunk(chunk)
+            except BaseException as e:
+                # built here, where the writer thread's traceback is still available
+                self._error = CustomException(e, sys)
+                logging.error(f"FactStreamSink: write failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def close(self) -> Dict[str, int]:
+        """Flush the queue, close the files and return {table: rows written}."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+            for writer in self._writers.values():
+                writer.close()
+            logging.info(
+                f"FactStreamSink: wrote {self.rows} to {self.paths} "
+                f"({self.write_seconds:.2f}s on the writer thread)"
+            )
+        self._raise_pending_error()
+        return dict(self.rows)
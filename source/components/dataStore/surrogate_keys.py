@@ -0,0 +1,110 @@
+import os
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+
+DEFAULT_LOOKUP_PATH = "data/match_keys.csv"
+# user attributes stay in users_dim; match_players only carries keys and agent/map picks
+MATCH_PLAYER_COLUMNS = ("match_key", "user_key", "agent_id", "agent_name", "map_id", "team A")
+
+
+def round_numbers(round_ids: pd.Series) -> np.ndarray:
+    """'MATCH_000001-R07' -> 7 as int8."""
+    return round_ids.astype(str).str.rsplit("-R", n=1).str[1].astype(np.int8).to_numpy()
+
+
+class MatchKeyRegistry:
+    """
+    Integer surrogate keys for the simulator's fact tables.
+
+    match_id strings map to dense int32 `match_key`s (assigned in the order
+    matches are first seen, so keys stay stable while chunks stream in), a
+    round is (match_key, round_no int8) and user_id becomes int32 `user_key`.
+    The readable ids live in one small lookup table:
+
+        keys = MatchKeyRegistry.load()
+        encoded = keys.encode(chunk)        # per simulator chunk
+        keys.save()                         # data/match_keys.csv
+    """
+
+    def __init__(self, lookup: Optional[pd.DataFrame] = None):
+        self._keys: Dict[str, int] = {}
+        self._dates: Dict[str, pd.Timestamp] = {}
+        if lookup is not None:
+            for key, match_id, match_date in zip(lookup["match_key"], lookup["match_id"], lookup["match_date"]):
+                self._keys[match_id] = int(key)
+                self._dates[match_id] = match_date
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_LOOKUP_PATH) -> "MatchKeyRegistry":
+        if not os.path.exists(path):
+            return cls()
+        return cls(pd.read_csv(path, parse_dates=["match_date"]))
+
+    def save(self, path: str = DEFAULT_LOOKUP_PATH) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.lookup().to_csv(f"{path}.tmp", index=False)
+        os.replace(f"{path}.tmp", path)
+
+    def lookup(self) -> pd.DataFrame:
+        """(match_key, match_id, match_date) for every match seen so far."""
+        return pd.DataFrame({
+            "match_key": np.fromiter(self._keys.values(), dtype=np.int32, count=len(self._keys)),
+            "match_id": list(self._keys),
+            "match_date": [self._dates.get(match_id) for match_id in self._keys],
+        })
+
+    def match_keys(self, match_ids: pd.Series) -> np.ndarray:
+        """int32 keys for `match_ids`, registering unseen ids."""
+        codes, uniques = pd.factorize(match_ids)
+        for match_id in uniques:
+            if match_id not in self._keys:
+                self._keys[match_id] = len(self._keys) + 1
+        return np.array([self._keys[match_id] for match_id in uniques], dtype=np.int32)[codes]
+
+    def _encode_table(self, df: pd.DataFrame) -> pd.DataFrame:
+        encoded = df.drop(columns=[c for c in ("match_id", "round_id") if c in df.columns])
+        if "round_id" in df.columns:
+            encoded.insert(0, "round_no", round_numbers(df["round_id"]))
+        encoded.insert(0, "match_key", self.match_keys(df["match_id"]))
+        return encoded
+
+    def encode(self, tables: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        Encode one simulator chunk ({name: DataFrame} from iter_match_details).
+
+        match_id/round_id become match_key/round_no. `match_df` is emitted as
+        `match_players` (match_key, user_key, agent, map, team) and gives
+        agent_perf_status a user_key and opponent_user_key.
+        """
+        match_df = tables.get("match_df")
+        encoded = {}
+        if match_df is not None:
+            for match_id, match_date in zip(match_df["match_id"], match_df["match_date"]):
+                self._dates.setdefault(match_id, match_date)
+            players = self._encode_table(match_df)
+            players.insert(1, "user_key", players.pop("user_id").astype(np.int32))
+            encoded["match_players"] = players[[c for c in MATCH_PLAYER_COLUMNS if c in players.columns]]
+
+        for name, df in tables.items():
+            if name == "match_df" or df.empty:
+                continue
+            if name == "agent_perf_status" and match_df is not None:
+                users = match_df[["match_id", "agent_name", "user_id"]]
+                df = df.merge(users, on=["match_id", "agent_name"], how="left", validate="many_to_one")
+                df = df.merge(
+                    users.rename(columns={"agent_name": "opponent", "user_id": "opponent_user_id"}),
+                    on=["match_id", "opponent"], how="left", validate="many_to_one",
+                )
+                df["user_key"] = df.pop("user_id").astype(np.int32)
+                df["opponent_user_key"] = df.pop("opponent_user_id").astype(np.int32)
+            encoded[name] = self._encode_table(df)
+        return encoded
+
+
+def decode(df: pd.DataFrame, lookup: pd.DataFrame) -> pd.DataFrame:
+    """Add match_id (and round_id for round-level tables) back to an encoded table."""
+    decoded = df.merge(lookup[["match_key", "match_id"]], on="match_key", how="left")
+    if "round_no" in decoded.columns:
+        decoded["round_id"] = decoded["match_id"] + "-R" + decoded["round_no"].astype(str).str.zfill(2)
+    return decoded
@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from source.components.features.player_form import (
+    DEFAULT_WINDOW, FEATURE_COLUMNS, load_simulator_tables, player_match_stats, rolling_form,
+)
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_MATRIX_DIR = "data/features/matrices"
+SCHEMA_NAME = "schema.json"
+FEATURE_DTYPE = np.float32
+LABEL_DTYPE = np.float32
+SPLITS = ("train", "validation", "test")
+# without --validation-start, the last 20% of the match days (before any test split) are validation
+DEFAULT_VALIDATION_FRACTION = 0.2
+# team-level features of the match matrix: the mean of each player's form
+TEAM_FEATURES = [c for c in FEATURE_COLUMNS if c != "form_matches"]
+
+
+def _codes(values: pd.Series) -> Tuple[np.ndarray, List[str]]:
+    """Sorted-category integer codes, so the same categories always get the same code."""
+    codes, categories = pd.factorize(values.astype(str), sort=True)
+    return codes, [str(c) for c in categories]
+
+
+def match_frame(tables: Dict[str, pd.DataFrame], form: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, List[str]]]:
+    """
+    One row per match: map, and the mean pre-match form of each team's
+    players (team_a_*/team_b_*). Label: team_a_won.
+    """
+    players = tables["match_players"][["match_id", "match_date", "user_id", "map_name", "team A"]]
+    stats = player_match_stats(tables)[["match_id", "user_id", "won"]]
+    players = players.merge(form[["match_id", "user_id"] + TEAM_FEATURES], on=["match_id", "user_id"], how="left") \
+        .merge(stats, on=["match_id", "user_id"], how="left")
+
+    teams = players.groupby(["match_id", "team A"], observed=True)[TEAM_FEATURES + ["won"]].mean().unstack("team A")
+    frame = pd.DataFrame(index=teams.index)
+    for column in TEAM_FEATURES:
+        frame[f"team_a_{column}"] = teams[(column, 1)]
+        frame[f"team_b_{column}"] = teams[(column, 0)]
+    frame["team_a_won"] = teams[("won", 1)]
+
+    info = players.drop_duplicates("match_id").set_index("match_id")[["match_date", "map_name"]]
+    frame = frame.join(info).reset_index()
+    frame["map"], map_categories = _codes(frame.pop("map_name"))
+    return frame, {"map": map_categories}
+
+
+def player_round_frame(tables: Dict[str, pd.DataFrame], form: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, List[str]]]:
+    """
+    One row per (round, player): round number, side, agent, map and the
+    player's pre-match form. Labels: round_won and kills in the round.
+    """
+    perf = tables["agent_perf_status"]
+    rounds = perf.groupby(["match_id", "round_id", "agent_name", "isAttacker"], observed=True, sort=False)["kills"] \
+        .sum().reset_index()
+    rounds = rounds.merge(tables["round_status"][["round_id", "winning_side"]], on="round_id", how="left",
+                          validate="many_to_one")
+    side = np.where(rounds["isAttacker"] == 1, "attacker", "defender")
+    rounds["round_won"] = (rounds.pop("winning_side").to_numpy() == side).astype(np.int8)
+    rounds["round_no"] = rounds["round_id"].astype(str).str.rsplit("-R", n=1).str[1].astype(np.int16)
+
+    players = tables["match_players"][["match_id", "match_date", "user_id", "agent_name", "map_name"]]
+    frame = rounds.merge(players, on=["match_id", "agent_name"], how="left", validate="many_to_one") \
+        .merge(form[["match_id", "user_id"] + FEATURE_COLUMNS], on=["match_id", "user_id"], how="left")
+    frame["agent"], agent_categories = _codes(frame.pop("agent_name"))
+    frame["map"], map_categories = _codes(frame.pop("map_name"))
+    return frame, {"agent": agent_categories, "map": map_categories}
+
+
+def _split_ranges(dates: np.ndarray, validation_start: Optional[str], test_start: Optional[str]) -> Dict[str, Any]:
+    """Row ranges of each split over rows sorted by date: train < validation_start <= validation < test_start <= test."""
+    def first_row(start: Optional[str]) -> int:
+        return int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start).date(), "D"))) if start else len(dates)
+
+    test = first_row(test_start)
+    bounds = [0, min(first_row(validation_start), test), test, len(dates)]
+    splits = {}
+    for name, lo, hi in zip(SPLITS, bounds[:-1], bounds[1:]):
+        splits[name] = {
+            "rows": [lo, hi],
+            "dates": [str(pd.Timestamp(dates[lo]).date()), str(pd.Timestamp(dates[hi - 1]).date())] if hi > lo else None,
+        }
+    return splits
+
+
+def default_validation_start(
+        match_dates: pd.Series,
+        fraction: float = DEFAULT_VALIDATION_FRACTION,
+        test_start: Optional[str] = None) -> Optional[str]:
+    """First day of the last `fraction` of the distinct match days before `test_start`; None with fewer than 2 days."""
+    days = np.unique(pd.to_datetime(match_dates).to_numpy(dtype="datetime64[D]"))
+    if test_start:
+        days = days[days < np.datetime64(pd.Timestamp(test_start).date(), "D")]
+    if len(days) < 2:
+        return None
+    validation_days = min(max(int(round(len(days) * fraction)), 1), len(days) - 1)
+    return str(days[-validation_days])
+
+
+def export_matrix(
+        frame: pd.DataFrame,
+        name: str,
+        features: Sequence[str],
+        labels: Sequence[str],
+        categories: Optional[Dict[str, List[str]]] = None,
+        sort_by: Sequence[str] = ("match_date", "match_id"),
+        validation_start: Optional[str] = None,
+        test_start: Optional[str] = None,
+        root: str = DEFAULT_MATRIX_DIR) -> Dict[str, Any]:
+    """
+    Write `frame` as `<root>/<name>/X.npy` (float32, rows x features),
+    `y.npy` (float32, rows x labels), `dates.npy` and `schema.json`.
+
+    Rows are sorted by date, so each split (train < validation_start <=
+    validation < test_start <= test) is one contiguous row range recorded in
+    the schema, and load_matrix() returns it as a zero-copy memmap slice.
+    Categorical features are stored as integer codes listed in the schema;
+    missing values are NaN. Returns the schema.
+    """
+    try:
+        frame = frame.sort_values(list(sort_by), kind="stable").reset_index(drop=True)
+        dates = frame["match_date"].to_numpy(dtype="datetime64[D]")
+        out_dir = os.path.join(root, name)
+        tmp_dir = f"{out_dir}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        np.save(os.path.join(tmp_dir, "X.npy"), frame[list(features)].to_numpy(dtype=FEATURE_DTYPE, na_value=np.nan))
+        np.save(os.path.join(tmp_dir, "y.npy"), frame[list(labels)].to_numpy(dtype=LABEL_DTYPE, na_value=np.nan))
+        np.save(os.path.join(tmp_dir, "dates.npy"), dates)
+
+        categories = categories or {}
+        schema = {
+            "name": name,
+            "rows": len(frame),
+            "features": [
+                {"name": column, "index": i, "dtype": np.dtype(FEATURE_DTYPE).name,
+                 **({"kind": "categorical", "categories": categories[column]} if column in categories
+                    else {"kind": "numeric"})}
+                for i, column in enumerate(features)
+            ],
+            "labels": [{"name": column, "index": i, "dtype": np.dtype(LABEL_DTYPE).name} for i, column in enumerate(labels)],
+            "sorted_by": list(sort_by),
+            "splits": _split_ranges(dates, validation_start, test_start),
+        }
+        with open(os.path.join(tmp_dir, SCHEMA_NAME), "w", encoding="utf-8") as file:
+            json.dump(schema, file, indent=1)
+        shutil.rmtree(out_dir, ignore_errors=True)
+        os.rename(tmp_dir, out_dir)
+        ranges = {split: bounds["rows"] for split, bounds in schema["splits"].items()}
+        logging.info(f"export_matrix: {name} {len(frame)} x {len(features)} -> {out_dir} {ranges}")
+        return schema
+    except Exception as e:
+        logging.error(f"export_matrix failed for {name}: {e}")
+        raise CustomException(e, sys)
+
+
+def load_schema(name: str, root: str = DEFAULT_MATRIX_DIR) -> Dict[str, Any]:
+    with open(os.path.join(root, name, SCHEMA_NAME), "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def load_matrix(name: str, split: Optional[str] = None, root: str = DEFAULT_MATRIX_DIR) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (X, y) of an exported matrix as read-only memmaps; with `split`, the
+    split's row range as a zero-copy slice. Nothing is read until used.
+    """
+    X = np.load(os.path.join(root, name, "X.npy"), mmap_mode="r")
+    y = np.load(os.path.join(root, name, "y.npy"), mmap_mode="r")
+    if split is None:
+        return X, y
+    lo, hi = load_schema(name, root)["splits"][split]["rows"]
+    return X[lo:hi], y[lo:hi]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description="Export simulator features as memory-mappable .npy matrices.")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--out", default=DEFAULT_MATRIX_DIR)
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="matches per player-form window")
+    parser.add_argument("--validation-start", default=None,
+                        help="first match_date of the validation split (default: the last "
+                             f"{DEFAULT_VALIDATION_FRACTION:.0%} of the match days)")
+    parser.add_argument("--test-start", default=None, help="first match_date of the test split")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    tables = load_simulator_tables(args.data_dir, extra_columns={"match_players": ["map_name", "team A"]})
+    form = rolling_form(player_match_stats(tables), args.window)
+    validation_start = args.validation_start or default_validation_start(
+        tables["match_players"]["match_date"], test_start=args.test_start
+    )
+    splits = {"validation_start": validation_start, "test_start": args.test_start, "root": args.out}
+
+    matches, match_categories = match_frame(tables, form)
+    schemas = {"matches": export_matrix(
+        matches, "matches",
+        features=["map"] + [c for c in matches.columns if c.startswith(("team_a_form", "team_b_form"))],
+        labels=["team_a_won"], categories=match_categories, **splits,
+    )}
+    rounds, round_categories = player_round_frame(tables, form)
+    schemas["player_rounds"] = export_matrix(
+        rounds, "player_rounds",
+        features=["round_no", "isAttacker", "agent", "map"] + FEATURE_COLUMNS,
+        labels=["round_won", "kills"], categories=round_categories,
+        sort_by=("match_date", "match_id", "round_no", "user_id"), **splits,
+    )
+    logging.info(f"matrix_export: exported {list(schemas)} in {time.perf_counter() - start:.2f}s")
+    return schemas
+
+
+if __name__ == "__main__":
+    main()
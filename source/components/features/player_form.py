@@ -0,0 +1,212 @@
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from source.components.dataStore.arrow_ipc import read_arrow, write_arrow
+from source.exceptions import CustomException
+from source.logger import logging
+
+DEFAULT_WINDOW = 10
+DEFAULT_FEATURES_PATH = "data/features/player_form.arrow"
+DEFAULT_STATE_PATH = "data/features/player_form_state.arrow"
+# simulator columns the pipeline reads; everything else is left on disk
+SOURCE_COLUMNS: Dict[str, List[str]] = {
+    "match_players": ["match_id", "match_date", "user_id", "agent_name"],
+    "agent_perf_status": ["match_id", "round_id", "agent_name", "isAttacker", "opponent",
+                          "kills", "head_hit", "body_hit", "leg_hit"],
+    "round_status": ["round_id", "winning_side"],
+}
+STAT_COLUMNS = ["kills", "deaths", "head_hits", "total_hits", "rounds_played", "rounds_won", "won"]
+FEATURE_COLUMNS = ["form_matches", "form_kd", "form_headshot_pct", "form_win_rate",
+                   "form_round_win_rate", "form_agent_diversity"]
+
+
+def load_simulator_tables(
+        data_dir: str = "data",
+        extra_columns: Optional[Dict[str, List[str]]] = None) -> Dict[str, pd.DataFrame]:
+    """The SOURCE_COLUMNS (plus `extra_columns`) of each table, from `<table>.arrow` when present, else the CSV."""
+    tables = {}
+    for name, columns in SOURCE_COLUMNS.items():
+        columns = columns + (extra_columns or {}).get(name, [])
+        arrow_path = os.path.join(data_dir, f"{name}.arrow")
+        if os.path.exists(arrow_path):
+            tables[name] = read_arrow(arrow_path, columns)
+        else:
+            tables[name] = pd.read_csv(os.path.join(data_dir, f"{name}.csv"), usecols=columns,
+                                       parse_dates=["match_date"] if "match_date" in columns else None)
+    return tables
+
+
+def player_match_stats(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    One row per (match, player): kills, deaths, head/total hits, rounds
+    played/won and whether the player's team won the match. `tables` holds
+    match_players (or a chunk's match_df), agent_perf_status and round_status.
+    """
+    players = tables["match_players"] if "match_players" in tables else tables["match_df"]
+    players = players[["match_id", "match_date", "user_id", "agent_name"]]
+    perf = tables["agent_perf_status"]
+
+    hits = perf["head_hit"] + perf["body_hit"] + perf["leg_hit"]
+    per_round = perf.assign(total_hits=hits).groupby(
+        ["match_id", "round_id", "agent_name", "isAttacker"], observed=True, sort=False
+    )[["kills", "head_hit", "total_hits"]].sum().reset_index()
+    winners = tables["round_status"][["round_id", "winning_side"]]
+    per_round = per_round.merge(winners, on="round_id", how="left", validate="many_to_one")
+    side = np.where(per_round["isAttacker"] == 1, "attacker", "defender")
+    per_round["rounds_won"] = (per_round["winning_side"].to_numpy() == side).astype(np.int64)
+    per_round["rounds_played"] = 1
+
+    stats = per_round.groupby(["match_id", "agent_name"], observed=True, sort=False)[
+        ["kills", "head_hit", "total_hits", "rounds_played", "rounds_won"]
+    ].sum().rename(columns={"head_hit": "head_hits"})
+    stats["deaths"] = perf.groupby(["match_id", "opponent"], observed=True, sort=False)["kills"].sum() \
+        .rename_axis(["match_id", "agent_name"]).reindex(stats.index, fill_value=0)
+    stats = players.merge(stats.reset_index(), on=["match_id", "agent_name"], how="inner", validate="one_to_one")
+    stats["won"] = (2 * stats["rounds_won"] > stats["rounds_played"]).astype(np.int64)
+    stats["match_date"] = pd.to_datetime(stats["match_date"])
+    return stats[["match_id", "match_date", "user_id", "agent_name"] + STAT_COLUMNS]
+
+
+def rolling_form(stats: pd.DataFrame, window: int = DEFAULT_WINDOW) -> pd.DataFrame:
+    """
+    Each player's form over their previous `window` matches, for every row of
+    `stats` (from player_match_stats). Only matches strictly before the row's
+    match count, ordered by (match_date, match_id), so nothing about the match
+    being predicted leaks into its features; a player's first match gets NaN.
+
+    Rows are sorted by player and time once; every window sum is then a
+    difference of two cumulative sums, c[i] - c[max(i - window, first row of
+    the player)], with no per-player loop.
+    """
+    stats = stats.sort_values(["user_id", "match_date", "match_id"], kind="stable").reset_index(drop=True)
+    n = len(stats)
+    position = np.arange(n)
+    users = stats["user_id"].to_numpy()
+    first = np.r_[True, users[1:] != users[:-1]] if n else np.zeros(0, dtype=bool)
+    group_start = np.maximum.accumulate(np.where(first, position, 0)) if n else position
+    start = np.maximum(position - window, group_start)
+
+    def window_sum(values: np.ndarray) -> np.ndarray:
+        cumulative = np.zeros(n + 1, dtype=np.float64)
+        np.cumsum(values, out=cumulative[1:])
+        return cumulative[position] - cumulative[start]
+
+    sums = {column: window_sum(stats[column].to_numpy(dtype=np.float64)) for column in STAT_COLUMNS}
+    matches = (position - start).astype(np.int64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        seen = np.where(matches > 0, 1.0, np.nan)
+        features = pd.DataFrame({
+            "form_matches": matches,
+            "form_kd": sums["kills"] / np.maximum(sums["deaths"], 1) * seen,
+            "form_headshot_pct": np.where(sums["total_hits"] > 0, sums["head_hits"] / sums["total_hits"], np.nan) * seen,
+            "form_win_rate": sums["won"] / matches * seen,
+            "form_round_win_rate": sums["rounds_won"] / sums["rounds_played"] * seen,
+        })
+
+    # distinct agents in the window: one cumulative count per agent
+    codes, agents = pd.factorize(stats["agent_name"])
+    diversity = np.zeros(n, dtype=np.int64)
+    for code in range(len(agents)):
+        diversity += window_sum((codes == code).astype(np.float64)) > 0
+    features["form_agent_diversity"] = diversity
+
+    return pd.concat([stats[["match_id", "match_date", "user_id"]], features], axis=1)
+
+
+class PlayerForm:
+    """
+    Incremental rolling_form(): keeps each player's last `window` matches as
+    state, so appending a new day only processes that day's matches:
+
+        form = PlayerForm.load()
+        features = form.extend(player_match_stats(new_day_tables))
+        form.save()
+
+    extend() refuses matches dated on or before the latest day already seen:
+    earlier ones would change features that were already served, and ties on
+    that day are ordered by match_id, which restarts every simulator run. So
+    a day is appended whole, once.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, state: Optional[pd.DataFrame] = None):
+        self.window = window
+        self.state = state if state is not None else pd.DataFrame(
+            columns=["match_id", "match_date", "user_id", "agent_name"] + STAT_COLUMNS
+        )
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_STATE_PATH, window: int = DEFAULT_WINDOW) -> "PlayerForm":
+        if not os.path.exists(path):
+            return cls(window)
+        return cls(window, read_arrow(path))
+
+    def save(self, path: str = DEFAULT_STATE_PATH) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write_arrow(self.state.reset_index(drop=True), f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+
+    def extend(self, stats: pd.DataFrame) -> pd.DataFrame:
+        """Features for the matches in `stats`, using the stored history; updates the history."""
+        try:
+            if stats.empty:
+                return rolling_form(stats, self.window)
+            if not self.state.empty and stats["match_date"].min() <= self.state["match_date"].max():
+                raise ValueError(
+                    f"PlayerForm.extend: matches from {stats['match_date'].min():%Y-%m-%d} are not newer than "
+                    f"the history ({self.state['match_date'].max():%Y-%m-%d}); rebuild with rolling_form()"
+                )
+            history = self.state.assign(_new=False) if not self.state.empty else None
+            combined = pd.concat([history, stats.assign(_new=True)], ignore_index=True) if history is not None \
+                else stats.assign(_new=True)
+            combined["match_date"] = pd.to_datetime(combined["match_date"])
+            combined = combined.sort_values(["user_id", "match_date", "match_id"], kind="stable").reset_index(drop=True)
+            is_new = combined.pop("_new").to_numpy(dtype=bool)
+
+            features = rolling_form(combined, self.window)[is_new].reset_index(drop=True)
+            self.state = combined.groupby("user_id", sort=False).tail(self.window).reset_index(drop=True)
+            return features
+        except ValueError:
+            raise
+        except Exception as e:
+            logging.error(f"PlayerForm.extend failed: {e}")
+            raise CustomException(e, sys)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    parser = argparse.ArgumentParser(description="Rolling player-form features from the simulator outputs.")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="matches per rolling window")
+    parser.add_argument("--out", default=DEFAULT_FEATURES_PATH)
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"extend the history in {DEFAULT_STATE_PATH} with matches newer than it")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = player_match_stats(load_simulator_tables(args.data_dir))
+    if args.incremental:
+        form = PlayerForm.load(window=args.window)
+        if not form.state.empty:
+            # the same rule as extend(): only days after the history's last day
+            stats = stats[stats["match_date"] > form.state["match_date"].max()]
+        features = form.extend(stats)
+        if os.path.exists(args.out):
+            features = pd.concat([read_arrow(args.out), features], ignore_index=True)
+    else:
+        form = PlayerForm(args.window)
+        features = form.extend(stats)
+    form.save()
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    # the previous file may still be memory-mapped by `features`; replace it instead of overwriting
+    write_arrow(features, f"{args.out}.tmp")
+    os.replace(f"{args.out}.tmp", args.out)
+    logging.info(f"player_form: {len(stats)} player-matches -> {args.out} in {time.perf_counter() - start:.2f}s")
+    return features
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import pandas as pd
+from typing import List, Dict, Any
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+BUDDIES_SCHEMA = DimensionSchema([
+    Field("uuid", "uuid"),
+    Field("name", "displayName"),
+    Field("isHiddenIfNotOwned", "isHiddenIfNotOwned"),
+    Field("themeUuid", "themeUuid"),
+    Field("levelsCount", "levels", default=(), dtype="int", transform=len),
+    Field("displayIcon", "displayIcon"),
+])
+
+def buddies_json_to_df(data: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Transform raw /buddies JSON (list of dicts) into a clean DataFrame.
+    """
+    return apply_dtype_policy(BUDDIES_SCHEMA.transform(data), "buddies")
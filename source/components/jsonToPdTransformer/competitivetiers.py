@@ -1,25 +1,82 @@
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+# One row per tier of every episode's tier table, keyed by (episode_idx, tier)
+COMPETITIVE_TIERS_SCHEMA = DimensionSchema(
+    [
+        Field("episode_idx", "episodeIndex", default=-1, dtype="int", parent=True),
+        Field("tier", "tier", default=-1, dtype="int"),
+        Field("uuid", "uuid", parent=True),
+        Field("Episode", "assetObjectName", parent=True),
+        Field("Rank", "tierName"),
+        Field("Icon", "largeIcon"),
+    ],
+    explode="tiers",
+)
+
+def index_episodes(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Stamp each episode with its position in the API response as
+    `episodeIndex`. Done before diffing so a re-transformed subset of episodes
+    keeps its global index.
+    """
+    return [
+        episode if "episodeIndex" in episode else {**episode, "episodeIndex": i}
+        for i, episode in enumerate(data)
+    ]
 
 def competitivetiers_json_to_df(data: List[Dict[str, Any]]) -> pd.DataFrame:
     """
-    Transform raw /competitivetiers JSON (list of dicts) into a clean DataFrame.
+    Transform raw /competitivetiers JSON (list of dicts) into a clean DataFrame
+    covering every episode, not just the latest one.
     """
-    records = []
-    for tier in data[-1:]:
-        uuid = tier.get("uuid")
-        episode = tier.get("assetObjectName")
-        for rank in tier.get("tiers", [{}]):
-            records.append({
-                "uuid": uuid,
-                "Episode": episode,
-                "Rank": rank.get("tierName"),
-                "Icon":rank.get("largeIcon")
+    return apply_dtype_policy(COMPETITIVE_TIERS_SCHEMA.transform(index_episodes(data)), "competitive_tiers")
+
+
+class CompetitiveTierIndex:
+    """
+    In-memory index over competitive_tiers_dim. Episodes are addressed by
+    `episode_idx` and tiers by their `tier` ordinal, so lookups are array
+    reads instead of DataFrame scans:
+
+        index = CompetitiveTierIndex(df_competitive_tiers)
+        index.tier("UNRANKED")                 # ordinal in the latest episode
+        index.rank_names[episode_idx, tier]    # name for an ordinal
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        valid = ((df["episode_idx"] >= 0) & (df["tier"] >= 0)).to_numpy()
+        positions = np.flatnonzero(valid)
+        df = df[valid]
+        episodes = df.drop_duplicates("episode_idx").sort_values("episode_idx")
+        n_episodes = int(episodes["episode_idx"].max()) + 1 if len(episodes) else 0
+        n_tiers = int(df["tier"].max()) + 1 if len(df) else 0
+
+        self.episode_uuids = np.full(n_episodes, None, dtype=object)
+        self.episode_uuids[episodes["episode_idx"].to_numpy()] = episodes["uuid"].to_numpy()
+        self.episode_ordinals = {uuid: int(idx) for idx, uuid in zip(episodes["episode_idx"], episodes["uuid"])}
+        self.latest_episode = n_episodes - 1
 
+        episode_idx = df["episode_idx"].to_numpy()
+        tier = df["tier"].to_numpy()
+        self.rank_names = np.full((n_episodes, n_tiers), None, dtype=object)
+        self.rank_names[episode_idx, tier] = df["Rank"].to_numpy()
+        # position in the indexed frame for each (episode, tier); -1 where absent
+        self.rows = np.full((n_episodes, n_tiers), -1, dtype=np.int64)
+        self.rows[episode_idx, tier] = positions
 
-            })
+        self._tier_ordinals = [{} for _ in range(n_episodes)]
+        for e, t, name in zip(episode_idx, tier, df["Rank"]):
+            self._tier_ordinals[e].setdefault(name, int(t))
 
+    def episode(self, uuid: str) -> int:
+        """Dense episode ordinal for an episode tier-table uuid."""
+        return self.episode_ordinals[uuid]
 
-    return pd.DataFrame(records)
-       
-   
\ No newline at end of file
+    def tier(self, name: str, episode_idx: Optional[int] = None) -> int:
+        """Tier ordinal for a rank name, in the latest episode by default."""
+        episode_idx = self.latest_episode if episode_idx is None else episode_idx
+        return self._tier_ordinals[episode_idx][name]
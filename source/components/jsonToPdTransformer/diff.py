@@ -0,0 +1,126 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from source.components.jsonToPdTransformer import dtypes, schema
+from source.logger import logging
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """Stable content hash of one raw API record."""
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def transformer_version(transformer: Callable) -> str:
+    """
+    Hash of the transformer's module, the schema engine and the dtype policy;
+    a code change to any of them forces a full rebuild.
+    """
+    digest = hashlib.sha1()
+    for module in (sys.modules[transformer.__module__], schema, dtypes):
+        digest.update(inspect.getsource(module).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_manifest(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_manifest(path: str, manifest: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=0, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def diff_transform(
+        data: List[Dict[str, Any]],
+        transformer: Callable[[List[Dict[str, Any]]], pd.DataFrame],
+        existing: Optional[pd.DataFrame] = None,
+        manifest: Optional[Dict[str, Any]] = None,
+        record_key: str = "uuid",
+        df_key: str = "uuid") -> Tuple[pd.DataFrame, Dict[str, int], Dict[str, Any]]:
+    """
+    Re-transform only the records of `data` whose content hash differs from
+    `manifest` and merge them into `existing`.
+
+    Rows of `existing` are matched on `df_key`, so transformers that emit
+    several rows per record (exploded lists) work too. Without a usable
+    manifest or `existing` frame, or after the transformer code changed,
+    everything is rebuilt.
+
+    Returns (dimension DataFrame, {"inserted", "updated", "deleted", "unchanged"},
+    new manifest).
+    """
+    version = transformer_version(transformer)
+    hashes = {record.get(record_key): record_hash(record) for record in data}
+
+    full_rebuild = (
+        existing is None
+        or manifest is None
+        or manifest.get("transformer_version") != version
+        or df_key not in existing.columns
+    )
+    old_hashes = {} if full_rebuild else manifest["hashes"]
+
+    inserted = [key for key in hashes if key not in old_hashes]
+    updated = [key for key in hashes if key in old_hashes and old_hashes[key] != hashes[key]]
+    deleted = [key for key in old_hashes if key not in hashes]
+    counts = {
+        "inserted": len(inserted),
+        "updated": len(updated),
+        "deleted": len(deleted),
+        "unchanged": len(hashes) - len(inserted) - len(updated),
+    }
+
+    if full_rebuild:
+        df = transformer(data)
+    else:
+        changed = set(inserted) | set(updated)
+        new_rows = transformer([record for record in data if record.get(record_key) in changed])
+        kept = existing[~existing[df_key].isin(set(updated) | set(deleted))]
+        df = pd.concat([kept, new_rows], ignore_index=True) if len(new_rows) else kept.reset_index(drop=True)
+        # keep the API's record order so unchanged rows do not move around
+        order = {key: i for i, key in enumerate(hashes)}
+        positions = df[df_key].astype(object).map(order).to_numpy(dtype=np.float64, na_value=np.inf)
+        df = df.iloc[np.argsort(positions, kind="stable")].reset_index(drop=True)
+
+    return df, counts, {"transformer_version": version, "hashes": hashes}
+
+
+def refresh_dimension(
+        name: str,
+        data: List[Dict[str, Any]],
+        transformer: Callable[[List[Dict[str, Any]]], pd.DataFrame],
+        data_dir: str = "data",
+        record_key: str = "uuid",
+        df_key: str = "uuid") -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    diff_transform against `<data_dir>/<name>_dim.csv` and its manifest in
+    `<data_dir>/manifests/<name>.json`. The CSV is only rewritten when something
+    changed, and the manifest is saved after the CSV so the two never disagree.
+    """
+    csv_path = os.path.join(data_dir, f"{name}_dim.csv")
+    manifest_path = os.path.join(data_dir, "manifests", f"{name}.json")
+    existing = pd.read_csv(csv_path) if os.path.exists(csv_path) else None
+
+    df, counts, manifest = diff_transform(
+        data, transformer, existing, load_manifest(manifest_path), record_key, df_key
+    )
+    # merged frames mix CSV-read and fresh rows; bring them back to the policy dtypes
+    df = dtypes.apply_dtype_policy(df, name)
+    changed = counts["inserted"] or counts["updated"] or counts["deleted"]
+    if existing is None or changed:
+        df.to_csv(csv_path, index=False)
+    save_manifest(manifest_path, manifest)
+    logging.info(f"refresh_dimension {name}: {counts}")
+    return df, counts
@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+from typing import Dict
+from source.logger import logging
+
+# Compact dtypes per dimension. Columns not listed keep whatever the transformer
+# produced. "percent" parses strings like "66%" into a float32 fraction (0.66).
+DTYPE_POLICIES: Dict[str, Dict[str, str]] = {
+    "agents": {
+        "uuid": "category",
+        "role": "category",
+        "isPlayable": "boolean",
+        "abilitiesCount": "int16",
+    },
+    "weapons": {
+        "uuid": "category",
+        "fireRate": "float32",
+        "magazineSize": "Int16",
+        "runSpeedMultiplier": "float32",
+        "equipTimeSeconds": "float32",
+        "reloadTimeSeconds": "float32",
+        "firstBulletAccuracy": "float32",
+        "fireMode": "category",
+        "adszoomMultiplier": "float32",
+        "adsfireRate": "float32",
+        "adsrunSpeedMultiplier": "float32",
+        "adsFirstBulletAccuracy": "float32",
+        "adsburstCount": "Int16",
+    },
+    "weapon_damage_ranges": {
+        "weapon_uuid": "category",
+        "range_start": "float32",
+        "range_end": "float32",
+        "head": "float32",
+        "body": "float32",
+        "leg": "float32",
+    },
+    "maps": {
+        "uuid": "category",
+    },
+    "gamemodes": {
+        "uuid": "category",
+    },
+    "gears": {
+        "uuid": "category",
+        "cost": "Int16",
+        "damageReduction": "category",
+        "damageAbsorbtion": "percent",
+    },
+    "competitive_tiers": {
+        "episode_idx": "int16",
+        "tier": "int16",
+        "uuid": "category",
+        "Episode": "category",
+        "Rank": "category",
+    },
+    "localized_names": {
+        "uuid": "category",
+        "locale": "category",
+    },
+    "skins": {
+        "uuid": "category",
+        "themeUuid": "category",
+        "contentTierUuid": "category",
+        "chromasCount": "int16",
+        "levelsCount": "int16",
+    },
+    "buddies": {
+        "uuid": "category",
+        "isHiddenIfNotOwned": "boolean",
+        "themeUuid": "category",
+        "levelsCount": "int16",
+    },
+    "playercards": {
+        "uuid": "category",
+        "isHiddenIfNotOwned": "boolean",
+        "themeUuid": "category",
+    },
+    "sprays": {
+        "uuid": "category",
+        "category": "category",
+        "themeUuid": "category",
+        "isNullSpray": "boolean",
+        "hideIfNotOwned": "boolean",
+    },
+}
+
+
+def parse_percent(series: pd.Series) -> pd.Series:
+    """'66%' -> 0.66 as float32; values without '%' are taken as fractions already."""
+    text = series.astype("string").str.strip()
+    has_percent = text.str.endswith("%").fillna(False).to_numpy(dtype=bool)
+    values = pd.to_numeric(text.str.rstrip("%"), errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(np.where(has_percent, values / 100, values).astype(np.float32), index=series.index)
+
+
+def _convert(series: pd.Series, dtype: str) -> pd.Series:
+    if dtype == "percent":
+        return parse_percent(series)
+    if dtype == "category":
+        return series.astype("category")
+    if dtype == "boolean":
+        return series.astype("boolean")
+    # numeric: go through to_numeric so CSV-read or object columns convert too
+    numeric = pd.to_numeric(series, errors="coerce")
+    if dtype.startswith(("int", "uint")) and numeric.isna().any():
+        # a plain numpy int cannot hold missing values; fall back to the nullable type
+        return numeric.astype(f"UInt{dtype[4:]}" if dtype.startswith("uint") else dtype.capitalize())
+    # numpy floats keep missing values as NaN
+    return numeric.astype(dtype)
+
+
+def apply_dtype_policy(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    """
+    Apply DTYPE_POLICIES[name] to `df`. The deep memory usage before and after
+    is logged and kept in df.attrs["memory_usage"].
+    """
+    policy = DTYPE_POLICIES.get(name, {})
+    before = int(df.memory_usage(deep=True).sum())
+    df = df.copy()
+    for column, dtype in policy.items():
+        if column in df.columns:
+            df[column] = _convert(df[column], dtype)
+    after = int(df.memory_usage(deep=True).sum())
+
+    df.attrs["memory_usage"] = {"before": before, "after": after}
+    logging.info(f"dtype policy {name}: {before} -> {after} bytes (deep)")
+    return df
@@ -1,22 +1,22 @@
 import pandas as pd
 from typing import List, Dict, Any
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+# Only the first "Standard" mode is kept
+GAMEMODES_SCHEMA = DimensionSchema(
+    [
+        Field("uuid", "uuid"),
+        Field("name", "displayName"),
+        Field("description", "description"),
+        Field("duration", "duration"),
+    ],
+    where=lambda mode: mode.get("displayName") == "Standard",
+    limit=1,
+)
 
 def gamemodes_json_to_df(data: List[Dict[str, Any]]) -> pd.DataFrame:
     """
     Transform raw /gamemodes JSON (list of dicts) into a clean DataFrame.
     """
-    records = []
-    for mode in data:
-        if mode.get("displayName") != "Standard":
-            continue
-        records.append({
-            "uuid": mode.get("uuid"),
-            "name": mode.get("displayName"),
-            "description": mode.get("description"),
-            "duration": mode.get("duration")
-        
-
-        })
-        break
-
-    return pd.DataFrame(records)
+    return apply_dtype_policy(GAMEMODES_SCHEMA.transform(data), "gamemodes")
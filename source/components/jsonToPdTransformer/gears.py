@@ -1,25 +1,21 @@
 import pandas as pd
 from typing import List, Dict, Any
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+GEARS_SCHEMA = DimensionSchema([
+    Field("uuid", "uuid"),
+    Field("name", "displayName"),
+    Field("description", "description"),
+    Field("cost", "shopData.cost"),
+    Field("armorImage", "displayIcon"),
+    Field("damageReduction", "details.0.value"),
+    Field("damageAbsorbtion", "details.1.value"),
+    Field("regenPool", "details.2.value"),
+])
 
 def gears_json_to_df(data: List[Dict[str, Any]]) -> pd.DataFrame:
     """
     Transform raw /gears JSON (list of dicts) into a clean DataFrame.
     """
-    records = []
-    for gears in data:
-
-        damageReduction,damageAbsorbtion,*extras = [i.get("value") for i in gears.get("details",[{}])]
-        regenPool = extras[0] if extras else None
-        records.append({
-            "uuid": gears.get("uuid"),
-            "name": gears.get("displayName"),
-            "description": gears.get("description"),
-            "cost": gears.get("shopData",[{}]).get("cost"),
-            "armorImage":gears.get("displayIcon"),
-            "damageReduction":damageReduction,
-            "damageAbsorbtion":damageAbsorbtion,
-            "regenPool":regenPool
-
-        })
-
-    return pd.DataFrame(records)
+    return apply_dtype_policy(GEARS_SCHEMA.transform(data), "gears")
@@ -0,0 +1,19 @@
+import pandas as pd
+from typing import List, Dict, Any
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+# one row per item of each locale's record list; the locale comes from the enclosing entry
+LOCALIZED_NAMES_SCHEMA = DimensionSchema([
+    Field("uuid", "uuid"),
+    Field("locale", "locale", parent=True),
+    Field("name", "displayName"),
+], explode="items")
+
+def localized_names_json_to_df(data: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+    """
+    Transform {locale: records} from ValorantAPIClient.get_localized into a
+    long (uuid, locale, name) DataFrame.
+    """
+    locales = [{"locale": locale, "items": items} for locale, items in data.items()]
+    return apply_dtype_policy(LOCALIZED_NAMES_SCHEMA.transform(locales), "localized_names")
@@ -1,18 +1,16 @@
 import pandas as pd
 from typing import List, Dict, Any
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+MAPS_SCHEMA = DimensionSchema([
+    Field("uuid", "uuid"),
+    Field("name", "displayName"),
+    Field("Icon", "displayIcon"),
+])
 
 def maps_json_to_df(data: List[Dict[str, Any]]) -> pd.DataFrame:
     """
     Transform raw /maps JSON (list of dicts) into a clean DataFrame.
     """
-    records = []
-    for map in data:
-        records.append({
-            "uuid": map.get("uuid"),
-            "name": map.get("displayName"),
-            "Icon": map.get("displayIcon")
-
-
-        })
-
-    return pd.DataFrame(records)
+    return apply_dtype_policy(MAPS_SCHEMA.transform(data), "maps")
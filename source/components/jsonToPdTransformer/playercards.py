@@ -0,0 +1,21 @@
+import pandas as pd
+from typing import List, Dict, Any
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+PLAYERCARDS_SCHEMA = DimensionSchema([
+    Field("uuid", "uuid"),
+    Field("name", "displayName"),
+    Field("isHiddenIfNotOwned", "isHiddenIfNotOwned"),
+    Field("themeUuid", "themeUuid"),
+    Field("displayIcon", "displayIcon"),
+    Field("smallArt", "smallArt"),
+    Field("wideArt", "wideArt"),
+    Field("largeArt", "largeArt"),
+])
+
+def playercards_json_to_df(data: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Transform raw /playercards JSON (list of dicts) into a clean DataFrame.
+    """
+    return apply_dtype_policy(PLAYERCARDS_SCHEMA.transform(data), "playercards")
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+Path = Union[str, Sequence[Union[str, int]]]
+
+# Column storage per declared type; "int" needs a non-None default
+_DTYPES = {"object": object, "float": np.float64, "float32": np.float32, "int": np.int64}
+_FLOAT_DTYPES = ("float", "float32")
+_MISSING = (KeyError, IndexError, TypeError)
+
+
+def _split_path(path: Path) -> Tuple[Union[str, int], ...]:
+    """'abilities.0.displayName' -> ('abilities', 0, 'displayName')"""
+    parts = path.split(".") if isinstance(path, str) else path
+    return tuple(int(p) if isinstance(p, str) and p.isdigit() else p for p in parts)
+
+
+def compile_path(path: Path, default: Any = None, transform: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], Any]:
+    """
+    Compile a field path into a single-argument extractor. Missing keys,
+    short lists and null intermediates all resolve to `default`.
+    """
+    keys = _split_path(path)
+    if len(keys) == 1:
+        (k0,) = keys
+
+        def extract(record):
+            try:
+                value = record[k0]
+            except _MISSING:
+                return default
+            return default if value is None else value
+    elif len(keys) == 2:
+        k0, k1 = keys
+
+        def extract(record):
+            try:
+                value = record[k0][k1]
+            except _MISSING:
+                return default
+            return default if value is None else value
+    else:
+        def extract(record):
+            value = record
+            try:
+                for key in keys:
+                    value = value[key]
+            except _MISSING:
+                return default
+            return default if value is None else value
+
+    if transform is None:
+        return extract
+
+    def extract_and_transform(record):
+        value = extract(record)
+        return default if value is default and default is None else transform(value)
+
+    return extract_and_transform
+
+
+class Field:
+    """
+    One output column: where to find it in a record and how to store it.
+
+    path      - dotted path into the record ('weaponStats.adsStats.fireRate')
+    default   - value used when any step of the path is missing or null
+    dtype     - 'object', 'float', 'float32' or 'int'
+    transform - optional callable applied to the extracted value (e.g. len)
+    parent    - resolve against the parent record of an exploded list
+    """
+
+    def __init__(
+            self,
+            name: str,
+            path: Path,
+            default: Any = None,
+            dtype: str = "object",
+            transform: Optional[Callable[[Any], Any]] = None,
+            parent: bool = False):
+        if dtype not in _DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r} for field {name}")
+        if dtype == "int" and default is None:
+            raise ValueError(f"Field {name} is 'int' and needs a non-None default")
+        self.name = name
+        self.path = path
+        self.default = np.nan if dtype in _FLOAT_DTYPES and default is None else default
+        self.dtype = dtype
+        self.transform = transform
+        self.parent = parent
+        self.extract = compile_path(path, self.default, transform)
+
+
+class DimensionSchema:
+    """
+    Declarative description of a dimension table. Paths are compiled once,
+    then transform() makes a single pass over the records, writing every
+    field straight into a preallocated typed column.
+
+    where   - optional predicate; records failing it are skipped
+    limit   - stop after this many output rows
+    explode - path to a list inside each record; one row per list item, with
+              `parent=True` fields read from the enclosing record
+    """
+
+    def __init__(
+            self,
+            fields: List[Field],
+            where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+            limit: Optional[int] = None,
+            explode: Optional[Path] = None):
+        self.fields = fields
+        self.where = where
+        self.limit = limit
+        self.explode = compile_path(explode, ()) if explode is not None else None
+        self.columns = [field.name for field in fields]
+
+    def _rows(self, data: List[Dict[str, Any]]):
+        for record in data:
+            if self.where is not None and not self.where(record):
+                continue
+            if self.explode is None:
+                yield record, record
+            else:
+                for item in self.explode(record) or ():
+                    yield record, item
+
+    def transform(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
+        rows = self._rows(data)
+        if self.explode is not None or self.where is not None:
+            # output size is not known up front
+            rows = list(rows)
+        n = len(rows) if isinstance(rows, list) else len(data)
+        if self.limit is not None:
+            n = min(n, self.limit)
+
+        columns = [np.empty(n, dtype=_DTYPES[field.dtype]) for field in self.fields]
+        setters = [
+            (column, field.extract, field.parent, field.dtype in _FLOAT_DTYPES)
+            for column, field in zip(columns, self.fields)
+        ]
+
+        for i, (parent, item) in enumerate(rows):
+            if i >= n:
+                break
+            for column, extract, from_parent, is_float in setters:
+                value = extract(parent if from_parent else item)
+                if is_float:
+                    try:
+                        column[i] = value
+                    except (TypeError, ValueError):
+                        column[i] = np.nan
+                else:
+                    column[i] = value
+
+        # let pandas narrow object columns (bool, str) the way DataFrame(records) would
+        return pd.DataFrame(dict(zip(self.columns, columns)), columns=self.columns).infer_objects()
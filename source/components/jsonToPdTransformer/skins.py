@@ -0,0 +1,20 @@
+import pandas as pd
+from typing import List, Dict, Any
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+SKINS_SCHEMA = DimensionSchema([
+    Field("uuid", "uuid"),
+    Field("name", "displayName"),
+    Field("themeUuid", "themeUuid"),
+    Field("contentTierUuid", "contentTierUuid"),
+    Field("chromasCount", "chromas", default=(), dtype="int", transform=len),
+    Field("levelsCount", "levels", default=(), dtype="int", transform=len),
+    Field("displayIcon", "displayIcon"),
+])
+
+def skins_json_to_df(data: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Transform raw /weapons/skins JSON (list of dicts) into a clean DataFrame.
+    """
+    return apply_dtype_policy(SKINS_SCHEMA.transform(data), "skins")
@@ -0,0 +1,21 @@
+import pandas as pd
+from typing import List, Dict, Any
+from source.components.jsonToPdTransformer.schema import DimensionSchema, Field
+from source.components.jsonToPdTransformer.dtypes import apply_dtype_policy
+
+SPRAYS_SCHEMA = DimensionSchema([
+    Field("uuid", "uuid"),
+    Field("name", "displayName"),
+    Field("category", "category"),
+    Field("themeUuid", "themeUuid"),
+    Field("isNullSpray", "isNullSpray"),
+    Field("hideIfNotOwned", "hideIfNotOwned"),
+    Field("displayIcon", "displayIcon"),
+    Field("animationGif", "animationGif"),
+])
+
+def sprays_json_to_df(data: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Transform raw /sprays JSON (list of dicts) into a clean DataFrame.
+    """
+    return apply_dtype_policy(SPRAYS_SCHEMA.transform(data), "sprays")
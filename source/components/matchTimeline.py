@@ -1,14 +1,35 @@
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterator, Optional
 import numpy as np
 import sys
+import argparse
+import contextlib
+import os
 from source.utils import biased_hbl_percentages, divide_number_randomly
 from source.exceptions import CustomException
 from source.logger import logging
+from source.components.dataStore.snapshot import DEFAULT_SNAPSHOT_DIR, load_dimensions, load_manifest
+from source.components.dataStore.parquet_facts import DEFAULT_FACTS_DIR, compact_fact_tables, reset_fact_tables, write_fact_tables
+from source.components.dataStore.stream_sink import FactStreamSink, SIM_TABLES, reset_sink_outputs, sink_paths
+from source.components.dataStore.surrogate_keys import DEFAULT_LOOKUP_PATH, MatchKeyRegistry
+from source.components.dataStore.run_cache import RunCache, code_version, file_digest, run_key
+from source.components.dataStore.sqlite_loader import DEFAULT_DB_PATH, DIMENSION_TABLES, StarSchemaLoader
+from source.components.dataStore.match_store import DEFAULT_STORE_DIR, MatchFactStore, reset_match_store
+from source.components.dataStore.match_index import DEFAULT_INDEX_DIR, build_indexes, match_players, reset_indexes
+from source.components.analytics.win_rate_cube import DEFAULT_CUBE_PATH, AgentMapSideCube
+from source.components.analytics.career_stats import DEFAULT_CAREER_DIR, CareerStats
 #from src.components.users import synthetic_users
 
 #generating match timeline initial data
 
+# Outputs of the simulator, in the order generate_all_match_details returns them
+MATCH_OUTPUTS = ("match_status", "round_status", "agent_perf_status", "round_spike_status", "match_df")
+
+# Simulation parameters; part of the run-cache key of the entry point
+TOTAL_ROUNDS = 25
+SPIKE_PLANT_PROBABILITY = 0.7
+SPIKE_DEFUSE_PROBABILITY = 0.2
+
 def generate_all_match_details(
     users_df: pd.DataFrame,
     agents_df: pd.DataFrame,
@@ -16,15 +37,50 @@ def generate_all_match_details(
     per_day_match_counter: int = 2,
     start_date: str = "2025-01-01",
     end_date: str = "today",
+    total_rounds: int = TOTAL_ROUNDS,
+    on_chunk: Optional[Callable[[Dict[str, pd.DataFrame]], None]] = None,
 ) -> pd.DataFrame:
     """
     Create a base dataframe of matches:
       - date range from start_date to end_date (daily)
       - per_day_match_counter matches per day
       - each match: 10 unique users, 10 unique agents, 1 map, sides assigned
+
+    Collects every chunk of iter_match_details; use that directly to stream.
+    on_chunk, if given, is called with each chunk as it is produced (e.g. CareerStats.update).
+    """
+    chunks = {name: [] for name in MATCH_OUTPUTS}
+    for chunk in iter_match_details(users_df, agents_df, maps_df, per_day_match_counter, start_date, end_date, total_rounds):
+        if on_chunk is not None:
+            on_chunk(chunk)
+        for name in MATCH_OUTPUTS:
+            chunks[name].append(chunk[name])
+
+    # Concatenate all results at once
+    match_status, round_status, agent_perf_status, round_spike_status, match_df = (
+        pd.concat(chunks[name], ignore_index=True) if chunks[name] else pd.DataFrame()
+        for name in MATCH_OUTPUTS
+    )
+    logging.info(f"Successfully completed generate_all_match_details")
+    return match_status, round_status, agent_perf_status, round_spike_status, match_df
+
+def iter_match_details(
+    users_df: pd.DataFrame,
+    agents_df: pd.DataFrame,
+    maps_df: pd.DataFrame,
+    per_day_match_counter: int = 2,
+    start_date: str = "2025-01-01",
+    end_date: str = "today",
+    total_rounds: int = TOTAL_ROUNDS,
+    chunk_matches: int = 100,
+) -> Iterator[Dict[str, pd.DataFrame]]:
+    """
+    Simulate the matches of generate_all_match_details and yield them every
+    `chunk_matches` matches as {name: DataFrame} for the names in
+    MATCH_OUTPUTS, so consumers can write while the simulation runs.
     """
     try:
-        logging.info("Starting generate_all_match_details")
+        logging.info("Starting iter_match_details")
         logging.debug(f"Input shapes - users: {users_df.shape}, agents: {agents_df.shape}, maps: {maps_df.shape}")
 
         # Date handling
@@ -106,9 +162,8 @@ def generate_all_match_details(
                 match_seq += 1
 
         if not all_rows:
-            logging.warning("No match rows generated. Returning empty DataFrames.")
-            # Return 5 empty DataFrames if no data
-            return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+            logging.warning("No match rows generated. Nothing to yield.")
+            return
 
         base_matches_df = pd.concat(all_rows, ignore_index=True)
         logging.info(f"Concatenated {len(all_rows)} match rows with shape {base_matches_df.shape}")
@@ -131,39 +186,30 @@ def generate_all_match_details(
         ]
         logging.info(f"Basic Match details generated")
 
-        match_df = pd.DataFrame()
-        match_status_list = []
-        round_status_list = []
-        agent_perf_status_list = []
-        round_spike_status_list = []
-        
-        for m_id in base_matches_df["match_id"].unique():
+        chunk = {name: [] for name in MATCH_OUTPUTS}
+        n_matches = base_matches_df["match_id"].nunique()
+        for n, (m_id, match_data) in enumerate(base_matches_df.groupby("match_id", sort=False), start=1):
             logging.debug(f"Processing match {m_id}")
-            match_data = base_matches_df[base_matches_df["match_id"] == m_id].reset_index(drop=True)
-            match_df = pd.concat([match_df, team_division(match_data)], ignore_index=True)
-            match_data_filtered = match_df[match_df["match_id"] == m_id].reset_index(drop=True)
+            match_data_filtered = team_division(match_data.reset_index(drop=True))
             match_status_per_match, round_status_per_match, agent_perf_status_per_match, round_spike_status_per_match = generating_full_match_details_per_round(
-                match_df=match_data_filtered, agents_df=agents_df
+                match_df=match_data_filtered, agents_df=agents_df, total_rounds=total_rounds
             )
-            match_status_list.append(match_status_per_match.reset_index(drop=True))
-            round_status_list.append(round_status_per_match.reset_index(drop=True))
-            agent_perf_status_list.append(agent_perf_status_per_match.reset_index(drop=True))
-            round_spike_status_list.append(round_spike_status_per_match.reset_index(drop=True))
-        
-        # Concatenate all results at once
-        match_status = pd.concat(match_status_list, ignore_index=True) if match_status_list else pd.DataFrame()
-        round_status = pd.concat(round_status_list, ignore_index=True) if round_status_list else pd.DataFrame()
-        agent_perf_status = pd.concat(agent_perf_status_list, ignore_index=True).reset_index(drop=True) if agent_perf_status_list else pd.DataFrame()
-        round_spike_status = pd.concat(round_spike_status_list, ignore_index=True) if round_spike_status_list else pd.DataFrame()
-        
-        logging.info(f"Successfully completed generate_all_match_details")
-        return match_status,round_status,agent_perf_status,round_spike_status, match_df
+            chunk["match_status"].append(match_status_per_match.reset_index(drop=True))
+            chunk["round_status"].append(round_status_per_match.reset_index(drop=True))
+            chunk["agent_perf_status"].append(agent_perf_status_per_match.reset_index(drop=True))
+            chunk["round_spike_status"].append(round_spike_status_per_match.reset_index(drop=True))
+            chunk["match_df"].append(match_data_filtered)
+
+            if n % chunk_matches == 0 or n == n_matches:
+                logging.info(f"iter_match_details: yielding matches up to {m_id} ({n}/{n_matches})")
+                yield {name: pd.concat(frames, ignore_index=True) for name, frames in chunk.items()}
+                chunk = {name: [] for name in MATCH_OUTPUTS}
     
     except CustomException as e:
-        logging.error(f"CustomException in generate_all_match_details: {str(e)}")
+        logging.error(f"CustomException in iter_match_details: {str(e)}")
         raise
     except Exception as e:
-        error_msg = f"Unexpected error in generate_all_match_details: {str(e)}"
+        error_msg = f"Unexpected error in iter_match_details: {str(e)}"
         logging.error(error_msg)
         raise CustomException(error_msg, sys)
 
@@ -221,7 +267,7 @@ def team_side_assignment(
 def generating_full_match_details_per_round(
         match_df: pd.DataFrame,
         agents_df: pd.DataFrame,
-        total_rounds: int = 25,
+        total_rounds: int = TOTAL_ROUNDS,
         first_round_credit: int = 800,
         attacker_round_wins: int = 0,
         defender_round_wins: int = 0,
@@ -238,6 +284,7 @@ def generating_full_match_details_per_round(
         match_details = []
         round_details = []
         round_durations = {}
+        round_winners = {}
         round_spike_status = pd.DataFrame()
         agent_perf_status = pd.DataFrame()
         for i in range (1, total_rounds + 1):
@@ -262,6 +309,7 @@ def generating_full_match_details_per_round(
             attacker_round_wins+= attacker_round_win
             defender_round_wins+= defender_round_win
             round_durations[round_id] = total_duration_round
+            round_winners[round_id] = "attacker" if attacker_round_win == 1 else "defender"
             logging.debug(f"Round {i} - Attackers: {attacker_round_wins} wins, Defenders: {defender_round_wins} wins")
 
             if attacker_round_wins == 13 or defender_round_wins == 13:
@@ -275,6 +323,7 @@ def generating_full_match_details_per_round(
         round_df = pd.DataFrame(round_details)
         round_status = round_df[["match_id","round_id"]].drop_duplicates().reset_index(drop=True)
         round_status["total_round_duration"] = round_status["round_id"].map(round_durations)
+        round_status["winning_side"] = round_status["round_id"].map(round_winners)
 
         logging.info(f"Match details completed - {len(round_status)} rounds")
         return match_status, round_status, agent_perf_status, round_spike_status
@@ -313,7 +362,7 @@ def events_per_round(
         kill_count_defender = {agent:0 for agent in round_df[round_df["isDefender"]==1]["agent_name"].tolist()}
 
         
-        agents_hit_damage = {agent:{ag: {"hit": {"head":0, "body":0, "leg":0},"damage":{"head":0,"body":0,"leg":0},"outgoing_damage":0, "incoming_damage":0} for ag in attacker_team+defender_team } for agent in attacker_team+defender_team}
+        agents_hit_damage = {agent:{ag: {"hit": {"head":0, "body":0, "leg":0},"damage":{"head":0,"body":0,"leg":0},"outgoing_damage":0, "incoming_damage":0, "kill":0} for ag in attacker_team+defender_team } for agent in attacker_team+defender_team}
 
         dead_attackers = []
         dead_defenders = []
@@ -395,6 +444,7 @@ def events_per_round(
                 "head_damage": stats.get("damage", {}).get("head", 0),
                 "body_damage": stats.get("damage", {}).get("body", 0),
                 "leg_damage": stats.get("damage", {}).get("leg", 0),
+                "kills": stats.get("kill", 0),
             })
 
         # 4. Apply the mapping to the whole dataframe
@@ -402,10 +452,16 @@ def events_per_round(
         # Ensure stat_cols has the same index as agent_perf_per_round
         stat_cols.index = agent_perf_per_round.index
         agent_perf_per_round = pd.concat([agent_perf_per_round.reset_index(drop=True), stat_cols.reset_index(drop=True)], axis=1)
+        agent_perf_per_round["kills"] = agent_perf_per_round["kills"].astype(np.int8)
 
         round_spike_status = round_summary[["match_id","round_id"]].drop_duplicates().reset_index(drop = True)
         round_spike_status["spike_planted"] = team_spike_planted
         round_spike_status["spike_defused"] = team_spike_diffused
+        # agents who planted/defused; typed as str so all-missing chunks keep the same schema
+        planter = next((r["agent_name"] for r in records if r.get("plants") == 1), None)
+        defuser = next((r["agent_name"] for r in records if r.get("defussed") == 1), None)
+        round_spike_status["planter"] = pd.Series(planter, index=round_spike_status.index, dtype="str")
+        round_spike_status["defuser"] = pd.Series(defuser, index=round_spike_status.index, dtype="str")
         logging.debug(f"Round {round_id} completed - Spike planted: {team_spike_planted}, Spike defused: {team_spike_diffused}")
             
         return records, round_spike_status, attacker_round_win, defender_round_win, total_duration_round, agent_perf_per_round
@@ -533,7 +589,7 @@ def kill_death_simulation_by_damage(
         death = 0
         
         if row_dict["isAttacker"] == 1:
-            spike_planted = np.random.choice([0,1], p=[0.3,0.7]) if team_spike_planted != 1 else 0
+            spike_planted = np.random.choice([0,1], p=[1 - SPIKE_PLANT_PROBABILITY, SPIKE_PLANT_PROBABILITY]) if team_spike_planted != 1 else 0
             row_dict["plants"] = spike_planted
             team_spike_planted = spike_planted if team_spike_planted is None or team_spike_planted == 0 else team_spike_planted
             for agent,health in defender_dict.items():
@@ -559,6 +615,7 @@ def kill_death_simulation_by_damage(
                     attacker_dict[row_dict["agent_name"]] = 0
                     death = 1
                     kill_count_defender[agent] +=1
+                    agent_hit_damage[agent][row_dict["agent_name"]]["kill"] = 1
                     defenders_alive -= 1
                     
                 else:
@@ -567,13 +624,14 @@ def kill_death_simulation_by_damage(
                 if hit_value >= health and health >0:
                     defender_dict[agent] = 0
                     kill_count_attacker[row_dict["agent_name"]] +=1
+                    agent_hit_damage[row_dict["agent_name"]][agent]["kill"] = 1
                     kill = kill_count_attacker[row_dict["agent_name"]]
                     attackers_alive -= 1
                 else:
                     defender_dict[agent] = health - hit_value
 
         elif row_dict["isDefender"] == 1:
-            spike_diffused = np.random.choice([0,1], p=[0.8,0.2]) if team_spike_planted == 1 and (team_spike_diffused is None or team_spike_diffused == 0) else 0
+            spike_diffused = np.random.choice([0,1], p=[1 - SPIKE_DEFUSE_PROBABILITY, SPIKE_DEFUSE_PROBABILITY]) if team_spike_planted == 1 and (team_spike_diffused is None or team_spike_diffused == 0) else 0
             row_dict["defussed"] = spike_diffused
             team_spike_diffused = spike_diffused if team_spike_diffused is None or team_spike_diffused == 0 else team_spike_diffused
             for agent,health in attacker_dict.items():
@@ -596,6 +654,7 @@ def kill_death_simulation_by_damage(
                     defender_dict[row_dict["agent_name"]] = 0
                     death = 1
                     kill_count_attacker[agent] +=1
+                    agent_hit_damage[agent][row_dict["agent_name"]]["kill"] = 1
                     attackers_alive -= 1
                     
                 else:
@@ -604,6 +663,7 @@ def kill_death_simulation_by_damage(
                 if hit_value >= health and health:
                     attacker_dict[agent] = 0
                     kill_count_defender[row_dict["agent_name"]] +=1
+                    agent_hit_damage[row_dict["agent_name"]][agent]["kill"] = 1
                     kill = kill_count_defender[row_dict["agent_name"]]
                     defenders_alive -= 1
                 else:
@@ -620,36 +680,164 @@ def kill_death_simulation_by_damage(
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate Valorant matches from the dimension tables.")
+    parser.add_argument("--per-day", type=int, default=2, help="matches per day (per_day_match_counter)")
+    parser.add_argument("--start-date", default="2025-01-01")
+    parser.add_argument("--end-date", default="today")
+    parser.add_argument("--seed", type=int, default=None, help="seed numpy's generator for a reproducible run")
+    parser.add_argument("--integer-keys", action="store_true",
+                        help="write int32 match_key/round_no/user_key; readable ids go to data/match_keys.csv")
+    parser.add_argument("--compression", choices=["gzip", "zstd"], default=None,
+                        help="compress the CSVs (data/<table>.csv.gz or .csv.zst); Arrow files stay uncompressed")
+    parser.add_argument("--arrow", action="store_true", help="also write data/<table>.arrow (Feather v2)")
+    parser.add_argument("--match-store", action="store_true",
+                        help=f"also upsert every chunk into the match_id-keyed store in {DEFAULT_STORE_DIR}")
+    parser.add_argument("--no-cache", action="store_true", help="recompute even if an identical run is cached")
+    # the sinks below run synchronously on the simulation thread, once per chunk
+    parser.add_argument("--no-parquet", action="store_true", help=f"skip the partitioned Parquet copy in {DEFAULT_FACTS_DIR}")
+    parser.add_argument("--no-sqlite", action="store_true", help=f"leave the SQLite star schema {DEFAULT_DB_PATH} untouched")
+    parser.add_argument("--no-analytics", action="store_true",
+                        help=f"skip the win-rate cube ({DEFAULT_CUBE_PATH}) and career stats ({DEFAULT_CAREER_DIR})")
+    args = parser.parse_args()
+
     try:
         logging.info("=" * 80)
         logging.info("Starting Valorant Match Timeline Generation")
         logging.info("=" * 80)
         
-        logging.info("Loading input CSV files...")
-        users_df = pd.read_csv("data/users_dim.csv", parse_dates=["join_date"])
-        agents_df = pd.read_csv("data/agents_dim.csv")
-        maps_df = pd.read_csv("data/maps_dim.csv")
+        manifest = load_manifest()
+        if manifest is not None:
+            logging.info("Loading dimension snapshot...")
+            dims = load_dimensions(["users", "agents", "maps"])
+            users_df, agents_df, maps_df = dims["users"], dims["agents"], dims["maps"]
+            # the three tables' files only: the manifest's created_at changes with every main.py run
+            dimension_digest = run_key({
+                name: file_digest(os.path.join(DEFAULT_SNAPSHOT_DIR, manifest["tables"][name]["file"]))
+                for name in ("users", "agents", "maps")
+            })
+        else:
+            logging.info("Loading input CSV files...")
+            users_df = pd.read_csv("data/users_dim.csv", parse_dates=["join_date"])
+            agents_df = pd.read_csv("data/agents_dim.csv")
+            maps_df = pd.read_csv("data/maps_dim.csv")
+            dimension_digest = run_key({
+                name: file_digest(f"data/{name}_dim.csv") for name in ("users", "agents", "maps")
+            })
         logging.info(f"Successfully loaded input files - users: {users_df.shape}, agents: {agents_df.shape}, maps: {maps_df.shape}")
-        
-        logging.info("Generating match timeline...")
-        match_status, round_status, agent_perf_status, round_spike_status, match_df = generate_all_match_details(
-            users_df,
-            agents_df,
-            maps_df
-        )
-        
-        logging.info("Writing output CSV files...")
-        match_status.to_csv("data/match_status.csv", index=False)
-        logging.info(f"Saved match_status to data/match_status.csv (shape: {match_status.shape})")
-        
-        round_status.to_csv("data/round_status.csv", index=False)
-        logging.info(f"Saved round_status to data/round_status.csv (shape: {round_status.shape})")
-        
-        agent_perf_status.to_csv("data/agent_perf_status.csv", index=False)
-        logging.info(f"Saved agent_perf_status to data/agent_perf_status.csv (shape: {agent_perf_status.shape})")
-        
-        round_spike_status.to_csv("data/round_spike_status.csv", index=False)
-        logging.info(f"Saved round_spike_status to data/round_spike_status.csv (shape: {round_spike_status.shape})")
+
+        # Content address of this run: identical inputs and code reuse the stored outputs
+        run_inputs = {
+            "dimensions": dimension_digest,
+            "per_day_match_counter": args.per_day,
+            "start_date": str(pd.to_datetime(args.start_date).date()),
+            "end_date": str(pd.to_datetime(args.end_date).normalize().date()),
+            "seed": args.seed,
+            "total_rounds": TOTAL_ROUNDS,
+            "spike_plant_probability": SPIKE_PLANT_PROBABILITY,
+            "spike_defuse_probability": SPIKE_DEFUSE_PROBABILITY,
+            "integer_keys": args.integer_keys,
+            "compression": args.compression,
+            "arrow": args.arrow,
+            "match_store": args.match_store,
+            "parquet": not args.no_parquet,
+            "sqlite": not args.no_sqlite,
+            "analytics": not args.no_analytics,
+            "code": code_version(),
+        }
+        key = run_key(run_inputs)
+        run_cache = RunCache(root="data/runs/simulation")
+        # an unseeded run is not reproducible, so it is neither reused nor stored
+        use_cache = args.seed is not None and not args.no_cache
+        # Built (and so validated, e.g. a missing zstandard) before anything of the previous
+        # run is deleted; files are only opened by the first write.
+        sink_tables = SIM_TABLES + ("match_players",)
+        formats = ["csv", "arrow"] if args.arrow else ["csv"]
+        sinks = [
+            FactStreamSink("data", tables=sink_tables, format=fmt, compression=args.compression if fmt == "csv" else None)
+            for fmt in formats
+        ]
+        # the indexes describe the previous run's tables; a restored run brings its own, a new run rebuilds them
+        reset_indexes()
+        # outputs whose presence depends on the flags; a restore removes the ones its run did not write
+        config_outputs = sink_paths("data", sink_tables) + [DEFAULT_LOOKUP_PATH, DEFAULT_STORE_DIR, DEFAULT_FACTS_DIR]
+        if use_cache and run_cache.restore(key, clean=config_outputs):
+            for sink in sinks:
+                sink.close()
+            logging.info(f"Run {key[:12]} already computed; restored its outputs from {run_cache.root}")
+            if manifest is not None and not args.no_sqlite:
+                # the restored database carries the dimensions of its run; bring them up to date with main's snapshot
+                with StarSchemaLoader() as db:
+                    db.load_dimensions(load_dimensions(list(DIMENSION_TABLES)))
+        else:
+            if args.seed is not None:
+                np.random.seed(args.seed)
+
+            logging.info("Generating match timeline...")
+            # Chunks are written as they are simulated: the CSVs by the sink's
+            # background thread, Parquet partitions, SQLite rows and the
+            # analytics on this thread (each can be skipped with --no-*).
+            keys = MatchKeyRegistry() if args.integer_keys else None
+
+            reset_fact_tables()
+            # e.g. .arrow files or match_keys.csv of an earlier run with other flags
+            reset_sink_outputs("data", sink_tables)
+            if not args.integer_keys and os.path.exists(DEFAULT_LOOKUP_PATH):
+                os.remove(DEFAULT_LOOKUP_PATH)
+            if args.match_store:
+                # match ids restart every run, so matches of a larger earlier run would otherwise linger
+                reset_match_store()
+            store = MatchFactStore() if args.match_store else None
+            cube = AgentMapSideCube() if not args.no_analytics else None
+            career = CareerStats() if not args.no_analytics else None
+            with (StarSchemaLoader() if not args.no_sqlite else contextlib.nullcontext()) as db:
+                # match/round ids restart every run, so an upsert would keep rows the new run does not produce
+                if db is not None:
+                    db.reset_facts()
+                for chunk in iter_match_details(
+                    users_df, agents_df, maps_df, args.per_day, args.start_date, args.end_date
+                ):
+                    facts = {name: chunk[name] for name in SIM_TABLES}
+                    output = keys.encode(chunk) if args.integer_keys else dict(facts, match_players=match_players(chunk["match_df"]))
+                    for sink in sinks:
+                        sink.write(output)
+                    if not args.no_parquet:
+                        write_fact_tables(facts, chunk["match_df"], mode="append")
+                    if db is not None:
+                        db.append_facts(facts, chunk["match_df"])
+                    if store is not None:
+                        store.upsert(facts)
+                    if cube is not None:
+                        cube.update(chunk)
+                        career.update(chunk)
+                if db is not None:
+                    db.analyze()
+            if not args.no_parquet:
+                # one file per chunk and partition so far; merge them into full row groups
+                compact_fact_tables()
+            if store is not None:
+                store.close()
+            if cube is not None:
+                cube.save()
+                career.save()
+            if args.integer_keys:
+                keys.save()
+
+            outputs = [DEFAULT_LOOKUP_PATH] if args.integer_keys else []
+            outputs += [DEFAULT_FACTS_DIR] if not args.no_parquet else []
+            outputs += [DEFAULT_DB_PATH] if not args.no_sqlite else []
+            outputs += [DEFAULT_CUBE_PATH, DEFAULT_CAREER_DIR] if not args.no_analytics else []
+            outputs += [DEFAULT_STORE_DIR] if args.match_store else []
+            for sink in sinks:
+                rows = sink.close()
+                outputs.extend(sink.paths.values())
+                for name, path in sink.paths.items():
+                    logging.info(f"Saved {name} to {path} ({rows[name]} rows)")
+            if args.arrow and not args.integer_keys:
+                build_indexes("data")
+                outputs.append(DEFAULT_INDEX_DIR)
+            if use_cache:
+                run_cache.store(key, outputs, run_inputs)
+                logging.info(f"Stored run {key[:12]} in {run_cache.root}")
         
         logging.info("=" * 80)
         logging.info("Match Timeline Generation Completed Successfully!")
@@ -663,4 +851,4 @@ if __name__ == "__main__":
         error_msg = f"Unexpected error in main execution: {str(e)}"
         logging.error(error_msg)
         logging.error("=" * 80)
-        raise
\ No newline at end of file
+        raise
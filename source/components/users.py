@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from source.components.jsonToPdTransformer.competitivetiers import competitivetiers_json_to_df
+from source.components.jsonToPdTransformer.competitivetiers import CompetitiveTierIndex
 from typing import List, Dict, Any
 
 # Number of synthetic users
@@ -25,16 +25,18 @@ def synthetic_users(data: pd.DataFrame) -> pd.DataFrame:
     join_dates = start_date + pd.to_timedelta(random_days, unit="D")
 
 
-    # 4) Rank tier: all start as 'Unranked' (get UUID from competitivetiers data)
-
-    unranked_tier_uuid = data[data['Rank'] == 'UNRANKED']['uuid'].values[0]
+    # 4) Rank tier: all start as 'Unranked' in the latest episode (resolved via the tier index)
+    tier_index = CompetitiveTierIndex(data)
+    unranked_tier_uuid = tier_index.episode_uuids[tier_index.latest_episode]
+    unranked_tier = tier_index.tier("UNRANKED")
     # 4) Build DimUser DataFrame
     df_users = pd.DataFrame({
         "user_id": range(1, n_users + 1),          # surrogate key
         "username": usernames,
         "tagline": taglines,
         "join_date": join_dates,       # all start as Unranked
-        "rank_tier_uuid": unranked_tier_uuid
+        "rank_tier_uuid": unranked_tier_uuid,
+        "rank_tier": unranked_tier
     })
     #df_users['rank_tier_uuid'] = unranked_tier_uuid
     return df_users
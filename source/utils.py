@@ -16,7 +16,8 @@ def biased_hbl_percentages(random_state=None, value: int=0):
     biased so head > body > leg on average.
     """
     if random_state is None:
-        random_state = np.random.RandomState()
+        # the global generator, so np.random.seed() makes simulations reproducible
+        random_state = np.random
 
     # Dirichlet parameters control the mean:
     # larger alpha -> more stable around that mean.